@@ -0,0 +1,175 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Checks every dataset in a store (or generated scenarios) on a process pool
+# and streams one JSON line per scenario:
+#   python banker_batch.py banker_data.json --workers 4
+#   python banker_batch.py --generate 10000 --processes 50 --resources 8
+#   python banker_batch.py nightly.db --cache banker_cache.db
+#
+# Exit status: 0 all safe, 1 any scenario unsafe, 2 any scenario could not be checked.
+
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from banker_cache import default_cache
+from banker_engine import bankers_algorithm
+from banker_store import JSON_SUFFIXES, JsonStore, open_store
+
+DATA_FILE = "banker_data.json"
+
+
+def evaluate(name, data, order="lowest", cache=None):
+    start = time.perf_counter()
+    try:
+        safe, sequence = bankers_algorithm(data["allocation"], data["maximum"], data["available"], order, cache=cache)
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        return {"name": name, "error": str(e)}
+    return {
+        "name": name,
+        "safe": safe,
+        "sequence": sequence,
+        "seconds": time.perf_counter() - start
+    }
+
+
+def evaluate_chunk(chunk, order="lowest", cache_path=None):
+    # Each worker process opens the cache file once and shares it across its jobs.
+    cache = default_cache(cache_path) if cache_path else None
+    results = [evaluate(name, data, order, cache) for name, data in chunk]
+    if cache:
+        # Pool workers leave without running atexit, so write what this chunk added now.
+        cache.flush()
+    return results
+
+
+def iter_datasets(path=DATA_FILE):
+    items = open_store(path, None).items()
+    first = next(items, None)
+    if first is None:
+        return
+    if path.endswith(JSON_SUFFIXES) and not isinstance(first[1], dict):
+        # One dataset (as banker_cli.py check takes), not a store: its entries are tables.
+        data = JsonStore(path).read_all()
+        if "allocation" in data:
+            yield path, data
+            return
+    yield first
+    yield from items
+
+
+def generate_datasets(count, processes, resources, seed=0, start=0):
+    # Each scenario has its own generator, so workers can build any slice on their own.
+    for k in range(start, start + count):
+        rng = random.Random(f"{seed}:{k}")
+        allocation = [[rng.randint(0, 3) for _ in range(resources)] for _ in range(processes)]
+        maximum = [[a + rng.randint(0, 5) for a in row] for row in allocation]
+        available = [rng.randint(0, 6) for _ in range(resources)]
+        yield f"gen_{seed}_{k}", {
+            "num_processes": processes,
+            "num_resources": resources,
+            "allocation": allocation,
+            "maximum": maximum,
+            "available": available
+        }
+
+
+def evaluate_generated(count, processes, resources, seed, start, order="lowest", cache_path=None):
+    return evaluate_chunk(generate_datasets(count, processes, resources, seed, start), order, cache_path)
+
+
+def chunked(items, size):
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def store_jobs(datasets, chunk_size=64, order="lowest", cache_path=None):
+    for chunk in chunked(datasets, chunk_size):
+        yield evaluate_chunk, (chunk, order, cache_path)
+
+
+def generated_jobs(count, processes, resources, seed=0, chunk_size=64, order="lowest", cache_path=None):
+    for start in range(0, count, chunk_size):
+        size = min(chunk_size, count - start)
+        yield evaluate_generated, (size, processes, resources, seed, start, order, cache_path)
+
+
+def run_batch(jobs, workers=None):
+    """
+    Runs (function, args) jobs that each return a list of results and yields the
+    results in job order, keeping only a couple of jobs per worker in flight.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for function, args in jobs:
+            yield from function(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for function, args in jobs:
+            pending.append(pool.submit(function, *args))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Banker's Algorithm on many datasets.")
+    parser.add_argument("store", nargs="?", default=DATA_FILE, help="dataset store, .json or SQLite (default: %(default)s)")
+    parser.add_argument("--generate", type=int, metavar="COUNT", help="check COUNT random scenarios instead of a store")
+    parser.add_argument("--processes", type=int, default=5)
+    parser.add_argument("--resources", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--order", choices=("lowest", "sweep", "any"), default="lowest")
+    parser.add_argument("-o", "--output", help="write JSON lines here instead of stdout")
+    parser.add_argument("--cache", nargs="?", const="banker_cache.db", metavar="PATH",
+                        help="reuse results from this result cache (default file: %(const)s)")
+    args = parser.parse_args(argv)
+    if args.generate is None and not os.path.exists(args.store):
+        # open_store would quietly create an empty SQLite store under a mistyped name.
+        parser.error(f"{args.store} does not exist.")
+
+    if args.generate is not None:
+        jobs = generated_jobs(args.generate, args.processes, args.resources, args.seed, args.chunk_size, args.order,
+                              args.cache)
+    else:
+        jobs = store_jobs(iter_datasets(args.store), args.chunk_size, args.order, args.cache)
+
+    status = 0
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        for result in run_batch(jobs, args.workers):
+            out.write(json.dumps(result) + "\n")
+            if "error" in result:
+                status = 2
+            elif not result["safe"]:
+                status = max(status, 1)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if args.cache:
+        stats = default_cache(args.cache).stats()
+        print(f"result cache: {stats['hits']} hits, {stats['misses']} misses in total", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Benchmarks every safety check backend on seeded states and writes JSON results:
+#   python banker_bench.py -o bench_before.json
+#   python banker_bench.py --sizes 1000000x128 --max-cells 200000000 -o big.json
+#   python banker_bench.py --compare bench_before.json bench_after.json
+#   python banker_bench.py --storage -o storage.json
+#
+# Cases: "safe" (random table with a hidden safe order), "unsafe" (the same table
+# with one process that can never finish), "worst" (only the last pending process
+# can run on every pass) and the 5P_3R / 3P_5R datasets from banker_data.json.
+#
+# --storage instead measures disk size, write time and load latency / peak memory
+# of a generated JSON store and a snapshot, plain and with every compression codec.
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from banker_batch import generate_datasets
+from banker_engine import BACKENDS
+from banker_snapshot import Snapshot, write_snapshot
+from banker_store import CODECS, JsonStore
+
+DATA_FILE = "banker_data.json"
+BASELINE_DATASETS = ("5P_3R", "3P_5R")
+SIZES = ((5, 3), (50, 8), (500, 16), (5000, 32), (50000, 64), (100000, 64), (1000000, 128))
+CASES = ("safe", "unsafe", "worst")
+
+# Largest table (n*m) each backend is timed on; python rescans are quadratic
+# and the worklist holds the table as python lists.
+BACKEND_MAX_CELLS = {"python": 50_000, "worklist": 20_000_000, "numpy": None}
+
+
+def make_state(case, n, m, seed=0):
+    rng = np.random.default_rng([seed, n, m, CASES.index(case)])
+    if case == "worst":
+        allocation = np.ones((n, m), dtype=np.int32)
+        need = np.repeat((n - 1 - np.arange(n, dtype=np.int32))[:, None], m, axis=1)
+        return allocation, allocation + need, np.zeros(m, dtype=np.int64)
+
+    # Hide a safe order: the k-th process in it never needs more than the work
+    # left after the first k processes have released their allocation.
+    allocation = rng.integers(0, 4, size=(n, m), dtype=np.int8)
+    available = rng.integers(0, 6, size=m).astype(np.int64)
+    order = rng.permutation(n)
+    released = allocation[order].astype(np.int64)
+    work = np.cumsum(released, axis=0) - released + available
+    need = np.empty((n, m), dtype=np.int64)
+    need[order] = np.minimum(rng.integers(0, 8, size=(n, m)), work)
+
+    if case == "unsafe":
+        # One process late in the order wants more than the system owns.
+        need[order[max(0, n - 1 - n // 10)], 0] = int(work[-1, 0] + released[-1, 0]) + 1
+    maximum = allocation + need
+    return allocation, maximum, available
+
+
+def dataset_state(name, path=DATA_FILE):
+    with open(path, "r") as f:
+        data = json.load(f)[name]
+    return np.array(data["allocation"]), np.array(data["maximum"]), np.array(data["available"])
+
+
+def measure(backend, allocation, maximum, available, repeat):
+    if backend != "numpy":
+        allocation, maximum, available = allocation.tolist(), maximum.tolist(), available.tolist()
+    run = BACKENDS[backend]
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        safe, _sequence = run(allocation, maximum, available)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        if elapsed > 1:
+            break
+
+    # Peak memory is taken on a separate run so tracing does not skew the timing.
+    tracemalloc.start()
+    run(allocation, maximum, available)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return safe, best, peak
+
+
+def timed(run, repeat):
+    """Best time of repeat calls, then the peak traced memory of one more."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_storage_benchmarks(datasets, store_size, snapshot_size, repeat, seed, log=sys.stderr):
+    # The last dataset is the worst case for a streamed JSON store.
+    items = list(generate_datasets(datasets, store_size[0], store_size[1], seed))
+    last = items[-1][0]
+    allocation, maximum, available = make_state("safe", snapshot_size[0], snapshot_size[1], seed)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix in ("",) + tuple(CODECS):
+            codec = suffix.lstrip(".") or "none"
+
+            path = os.path.join(tmp, "store.json" + suffix)
+            start = time.perf_counter()
+            JsonStore(path).save_many(items)
+            write = time.perf_counter() - start
+            seconds, peak = timed(lambda: JsonStore(path).load(last), repeat)
+            results.append({"format": "json", "codec": codec, "bytes": os.path.getsize(path),
+                            "write_seconds": write, "load_seconds": seconds, "peak_bytes": peak})
+
+            path = os.path.join(tmp, "state.bnk" + suffix)
+            start = time.perf_counter()
+            write_snapshot(path, allocation, maximum, available)
+            write = time.perf_counter() - start
+            # Summing touches every page, so the memory-mapped file is really read.
+            seconds, peak = timed(lambda: int(Snapshot(path).allocation.sum()), repeat)
+            results.append({"format": "snapshot", "codec": codec, "bytes": os.path.getsize(path),
+                            "write_seconds": write, "load_seconds": seconds, "peak_bytes": peak})
+
+    for r in results:
+        print(f"{r['format']:>8} {r['codec']:>4} {r['bytes'] / 1e6:10.2f} MB  write {r['write_seconds'] * 1e3:9.1f} ms  "
+              f"load {r['load_seconds'] * 1e3:9.1f} ms {r['peak_bytes'] / 1e6:9.2f} MB", file=log)
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes, backends, max_cells, repeat, seed, log=sys.stderr):
+    states = [(f"dataset:{name}",) + dataset_state(name) for name in BASELINE_DATASETS]
+    for n, m in sizes:
+        if max_cells and n * m > max_cells:
+            continue
+        for case in CASES:
+            states.append((case,) + make_state(case, n, m, seed))
+
+    results = []
+    for case, allocation, maximum, available in states:
+        n, m = allocation.shape
+        for backend in backends:
+            limit = BACKEND_MAX_CELLS[backend]
+            if limit and n * m > limit:
+                continue
+            safe, seconds, peak = measure(backend, allocation, maximum, available, repeat)
+            results.append({
+                "case": case,
+                "processes": n,
+                "resources": m,
+                "backend": backend,
+                "safe": safe,
+                "seconds": seconds,
+                "peak_bytes": peak
+            })
+            print(f"{case:>14} {n:>8}x{m:<4} {backend:>8} {'safe' if safe else 'unsafe':>6} "
+                  f"{seconds * 1e3:10.3f} ms {peak / 1e6:9.2f} MB", file=log)
+    return results
+
+
+def compare(old_path, new_path, tolerance):
+    """Prints the speed ratio of every common benchmark; returns 1 if any got slower than tolerance."""
+    def load(path):
+        with open(path, "r") as f:
+            report = json.load(f)
+        return {(r["case"], r["processes"], r["resources"], r["backend"]): r for r in report.get("results", [])}
+
+    old, new = load(old_path), load(new_path)
+    status = 0
+    for key in sorted(old.keys() & new.keys()):
+        ratio = new[key]["seconds"] / max(old[key]["seconds"], 1e-9)
+        flag = ""
+        if ratio > tolerance:
+            flag = "  REGRESSION"
+            status = 1
+        case, n, m, backend = key
+        print(f"{case:>14} {n:>8}x{m:<4} {backend:>8} {ratio:6.2f}x{flag}")
+    return status
+
+
+def parse_size(text):
+    n, m = text.lower().split("x")
+    return int(n), int(m)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Banker's Algorithm backends.")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=SIZES, metavar="NxM")
+    parser.add_argument("--backends", nargs="+", choices=tuple(BACKENDS), default=tuple(BACKENDS))
+    parser.add_argument("--max-cells", type=int, default=10_000_000, help="skip tables bigger than this (0: no limit)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two reports instead of running")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="slowdown ratio reported as a regression")
+    parser.add_argument("--storage", action="store_true", help="benchmark store / snapshot codecs instead of backends")
+    parser.add_argument("--storage-datasets", type=int, default=2000, help="datasets in the benchmarked JSON store")
+    parser.add_argument("--storage-size", type=parse_size, default=(50, 8), metavar="NxM", help="size of each of them")
+    parser.add_argument("--snapshot-size", type=parse_size, default=(100000, 64), metavar="NxM")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return compare(args.compare[0], args.compare[1], args.tolerance)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine()
+    }
+    if args.storage:
+        report["storage"] = run_storage_benchmarks(args.storage_datasets, args.storage_size, args.snapshot_size,
+                                                   args.repeat, args.seed)
+    else:
+        report["results"] = run_benchmarks(args.sizes, args.backends, args.max_cells, args.repeat, args.seed)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
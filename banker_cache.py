@@ -0,0 +1,247 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# On-disk cache of safety check results, so a state that was checked before
+# (a dataset reloaded in a GUI, a snapshot in tonight's batch) is answered
+# without scanning it again:
+#   safe, sequence = bankers_algorithm(allocation, maximum, available, cache=default_cache())
+#   python banker_cache.py stats
+#   python banker_cache.py clear
+#
+# Entries are keyed by a SHA-256 of the order and the three tables, so the same
+# numbers give the same key whether they come as lists or int64 arrays (arrays
+# of a smaller dtype are hashed as they are stored rather than widened). The
+# least recently used entries are dropped once the cache grows past max_bytes.
+# Hit and miss counts are kept in the file, so they add up over every process.
+#
+# Lookups must stay cheaper than the check they save: tables under MIN_CELLS
+# are checked directly without touching the cache, and new results, "used"
+# times and the counters are kept in memory and written in one transaction
+# every FLUSH_CHANGES changes or FLUSH_SECONDS (and at exit, or by flush()).
+
+import argparse
+import atexit
+import hashlib
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from array import array
+
+CACHE_FILE = "banker_cache.db"
+MAX_BYTES = 64 << 20
+ROW_OVERHEAD = 64  # key, verdict and bookkeeping of one entry, roughly
+MIN_CELLS = 4096  # smaller tables are checked faster than they are hashed and looked up
+FLUSH_CHANGES = 1024
+FLUSH_SECONDS = 2.0
+HASH_ROWS = 1 << 16  # rows of an array hashed at a time
+
+
+def update_hash(h, matrix):
+    if type(matrix).__module__.split(".")[0] == "numpy":
+        import numpy as np
+
+        dtype = matrix.dtype.newbyteorder("<") if matrix.dtype.itemsize > 1 else matrix.dtype
+        h.update(struct.pack("<8sB", dtype.str.encode("ascii"), matrix.ndim) + struct.pack(f"<{matrix.ndim}Q", *matrix.shape))
+        flat = matrix.reshape(len(matrix), -1) if matrix.ndim > 1 else matrix.reshape(1, -1)
+        for start in range(0, len(flat), HASH_ROWS):
+            h.update(np.ascontiguousarray(flat[start:start + HASH_ROWS], dtype=dtype))
+        return
+
+    rows = matrix and isinstance(matrix[0], (list, tuple))
+    shape = (len(matrix), len(matrix[0])) if rows else (len(matrix),)
+    h.update(struct.pack("<8sB", b"<i8", len(shape)) + struct.pack(f"<{len(shape)}Q", *shape))
+    values = array("q")
+    for row in (matrix if rows else [matrix]):
+        values.extend(row)
+    if sys.byteorder == "big":
+        values.byteswap()
+    h.update(values)
+
+
+def state_key(allocation, maximum, available, order="lowest"):
+    h = hashlib.sha256(order.encode("ascii"))
+    for matrix in (allocation, maximum, available):
+        update_hash(h, matrix)
+    return h.hexdigest()
+
+
+def pack_sequence(sequence):
+    values = array("i", sequence)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def unpack_sequence(blob):
+    values = array("i")
+    values.frombytes(blob)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+class ResultCache:
+    """
+    (safe, sequence) results in a SQLite file, evicted least recently used first.
+    One instance may be shared by the GUI thread and its worker threads.
+    Changes are written in batches; call flush() before another process needs them.
+    """
+
+    def __init__(self, path=CACHE_FILE, max_bytes=MAX_BYTES, min_cells=MIN_CELLS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.min_cells = min_cells
+        self.lock = threading.Lock()
+        self.added = {}  # key -> (safe, blob, size, used) not written yet
+        self.touched = {}  # key -> used, for hits on stored results
+        self.hits = self.misses = 0
+        self.flushed = time.monotonic()
+        self.db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        # A lost cache write only costs a recomputation, so commits need not wait for the disk.
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.db:
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    safe INTEGER NOT NULL,
+                    sequence BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    used INTEGER NOT NULL
+                )""")
+            self.db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+            self.db.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            self.db.execute("INSERT OR IGNORE INTO counters VALUES ('hits', 0), ('misses', 0)")
+
+    def get(self, key):
+        """Returns (safe, sequence) or None, and counts the hit or miss."""
+        with self.lock:
+            row = self.added.get(key)
+            if row is None:
+                row = self.db.execute("SELECT safe, sequence FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self.touched[key] = time.time_ns()
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            self.flush_due()
+        return None if row is None else (bool(row[0]), unpack_sequence(row[1]))
+
+    def put(self, key, safe, sequence):
+        blob = pack_sequence(sequence)
+        size = len(blob) + ROW_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            self.added[key] = (int(safe), blob, size, time.time_ns())
+            self.flush_due()
+
+    def flush_due(self):
+        if (len(self.added) + len(self.touched) >= FLUSH_CHANGES
+                or time.monotonic() - self.flushed >= FLUSH_SECONDS):
+            self.write()
+
+    def flush(self):
+        """Writes the results, "used" times and counts still held in memory."""
+        with self.lock:
+            self.write()
+
+    def write(self):
+        self.flushed = time.monotonic()
+        if not (self.added or self.touched or self.hits or self.misses):
+            return
+        with self.db:
+            self.db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                                ((key,) + row for key, row in self.added.items()))
+            self.db.executemany("UPDATE results SET used = ? WHERE key = ?",
+                                ((used, key) for key, used in self.touched.items()))
+            self.db.executemany("UPDATE counters SET value = value + ? WHERE name = ?",
+                                ((self.hits, "hits"), (self.misses, "misses")))
+            if self.added:
+                self.evict()
+        self.added.clear()
+        self.touched.clear()
+        self.hits = self.misses = 0
+
+    def evict(self):
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        oldest = []
+        for key, size in self.db.execute("SELECT key, size FROM results ORDER BY used"):
+            if total - freed <= self.max_bytes:
+                break
+            oldest.append((key,))
+            freed += size
+        self.db.executemany("DELETE FROM results WHERE key = ?", oldest)
+
+    def lookup(self, allocation, maximum, available, order, compute):
+        """The cached result for this state, or compute() stored for next time."""
+        if len(allocation) * len(available) < self.min_cells:
+            return compute()
+        key = state_key(allocation, maximum, available, order)
+        result = self.get(key)
+        if result is None:
+            result = compute()
+            self.put(key, *result)
+        return result
+
+    def stats(self):
+        with self.lock:
+            self.write()
+            counters = dict(self.db.execute("SELECT name, value FROM counters"))
+            entries, size = self.db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        return {"entries": entries, "bytes": size, "max_bytes": self.max_bytes,
+                "hits": counters["hits"], "misses": counters["misses"]}
+
+    def clear(self):
+        with self.lock, self.db:
+            self.added.clear()
+            self.touched.clear()
+            self.hits = self.misses = 0
+            self.db.execute("DELETE FROM results")
+            self.db.execute("UPDATE counters SET value = 0")
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+
+_open_caches = {}
+
+
+def default_cache(path=CACHE_FILE):
+    """The ResultCache at path shared by everything in this process, opened on first use."""
+    if path not in _open_caches:
+        _open_caches[path] = ResultCache(path)
+        atexit.register(_open_caches[path].flush)
+    return _open_caches[path]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect the Banker's Algorithm result cache.")
+    parser.add_argument("command", choices=("stats", "clear"))
+    parser.add_argument("--cache", default=CACHE_FILE)
+    args = parser.parse_args(argv)
+
+    cache = ResultCache(args.cache)
+    if args.command == "clear":
+        cache.clear()
+        print(f"Cleared {args.cache}.")
+    else:
+        stats = cache.stats()
+        lookups = stats["hits"] + stats["misses"]
+        rate = stats["hits"] / lookups if lookups else 0.0
+        print(f"{stats['entries']} results, {stats['bytes'] / 1e6:.2f} of {stats['max_bytes'] / 1e6:.2f} MB")
+        print(f"{stats['hits']} hits, {stats['misses']} misses ({rate:.0%} hit rate)")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Command line front-end, no prompts:
+#   python banker_cli.py check banker_data.json --name 5P_3R
+#   python banker_cli.py check state.txt          (or - for stdin, or a .bnk snapshot)
+#   python banker_cli.py request banker_data.json --name 5P_3R --pid 1 --vector "1 0 2"
+#   python banker_cli.py batch banker_data.json --workers 4
+#   python banker_cli.py animate banker_data.json --name 5P_3R
+#   python banker_cli.py animate 5P_3R.trc        (replay a trace from banker_trace.py)
+#   python banker_cli.py import --state state.txt --name big_case
+#   python banker_cli.py import --allocation alloc.csv --maximum max.csv --available avail.csv --name big_case
+#
+# Exit status: 0 safe / granted, 1 unsafe / denied, 2 bad input.
+# tkinter is never imported; numpy and matplotlib only by the subcommands that need them.
+
+import argparse
+import json
+import sys
+
+from banker_engine import ORDERS, bankers_algorithm
+
+EXIT_SAFE = 0
+EXIT_UNSAFE = 1
+EXIT_ERROR = 2
+
+
+def parse_text(text):
+    """
+    Whitespace separated numbers in the order os_1.py asks for them:
+    n, m, the n x m Allocation rows, the n x m Max rows, then m Available values.
+    """
+    numbers = [int(x) for x in text.split()]
+    if len(numbers) < 2:
+        raise ValueError("Expected the number of processes and resource types first.")
+    n, m = numbers[0], numbers[1]
+    if len(numbers) != 2 + 2 * n * m + m:
+        raise ValueError(f"Expected {2 * n * m + m} values for {n} processes and {m} resource types, got {len(numbers) - 2}.")
+    values = numbers[2:]
+    allocation = [values[i * m:(i + 1) * m] for i in range(n)]
+    values = values[n * m:]
+    maximum = [values[i * m:(i + 1) * m] for i in range(n)]
+    return {
+        "num_processes": n,
+        "num_resources": m,
+        "allocation": allocation,
+        "maximum": maximum,
+        "available": values[n * m:]
+    }
+
+
+def load_states(path, name=None):
+    """
+    Returns a list of (name, dataset) read from a JSON dataset, a dataset store,
+    a binary snapshot (arrays stay memory-mapped) or a text file; .gz / .xz
+    files are decompressed.
+    """
+    if path.endswith((".bnk", ".bnk.gz", ".bnk.xz")):
+        from banker_snapshot import Snapshot
+
+        snapshot = Snapshot(path)
+        return [(name or path, {"allocation": snapshot.allocation, "maximum": snapshot.maximum,
+                                "available": snapshot.available})]
+
+    if path.endswith(".db"):
+        from banker_store import SqliteStore
+
+        store = SqliteStore(path)
+        if name is None:
+            return list(store.items())
+        data = store.load(name)
+        if data is None:
+            raise KeyError(f"Dataset '{name}' not found in {path}.")
+        return [(name, data)]
+
+    if path == "-":
+        text = sys.stdin.read()
+    else:
+        from banker_store import JSON_SUFFIXES, open_file, stream_load
+
+        if name is not None and path.endswith(JSON_SUFFIXES):
+            # Only the named dataset is decoded; the rest of the store is skipped as it streams past.
+            with open_file(path) as f:
+                data = stream_load(f, name)
+            if data is not None:
+                return [(name, data)]
+
+        with open_file(path) as f:
+            text = f.read()
+
+    if not text.lstrip().startswith("{"):
+        try:
+            return [(name or path, parse_text(text))]
+        except ValueError:
+            # Not the os_1 layout; try CSV / sectioned text as written by banker_import.
+            from banker_import import parse_state
+
+            return [(name or path, parse_state(text))]
+
+    data = json.loads(text)
+    if "allocation" in data:
+        return [(name or path, data)]
+    if name is None:
+        return list(data.items())
+    if name not in data:
+        raise KeyError(f"Dataset '{name}' not found in {path}.")
+    return [(name, data[name])]
+
+
+def load_one(path, name):
+    states = load_states(path, name)
+    if len(states) != 1:
+        raise ValueError(f"{path} holds {len(states)} datasets, choose one with --name.")
+    return states[0][1]
+
+
+def format_sequence(sequence):
+    return ' -> '.join(f'P{p}' for p in sequence)
+
+
+def check(args):
+    cache = None
+    if args.cache:
+        from banker_cache import default_cache
+
+        cache = default_cache(args.cache)
+    status = EXIT_SAFE
+    for name, data in load_states(args.file, args.name):
+        safe, sequence = bankers_algorithm(data["allocation"], data["maximum"], data["available"], args.order,
+                                           cache=cache)
+        if args.json:
+            print(json.dumps({"name": name, "safe": safe, "sequence": sequence}))
+        elif safe:
+            print(f"{name}: SAFE {format_sequence(sequence)}")
+        else:
+            print(f"{name}: UNSAFE")
+        if not safe:
+            status = EXIT_UNSAFE
+    return status
+
+
+def request(args):
+    from banker_state import BankerState
+
+    state = BankerState.from_dataset(load_one(args.file, args.name))
+    vector = [int(x) for x in args.vector.replace(",", " ").split()]
+    granted = state.request(args.pid, vector)
+    if args.json:
+        print(json.dumps({"pid": args.pid, "granted": granted, "available": state.available.tolist()}))
+    else:
+        print(f"P{args.pid}: {'GRANTED' if granted else 'DENIED'}")
+    return EXIT_SAFE if granted else EXIT_UNSAFE
+
+
+def batch(argv):
+    import banker_batch
+
+    return banker_batch.main(argv)
+
+
+def animate(args):
+    from banker_trace import Trace, record
+
+    if args.file.endswith(".trc"):
+        trace = Trace.open(args.file)
+    else:
+        data = load_one(args.file, args.name)
+        trace = record(data["allocation"], data["maximum"], data["available"])
+    if not trace.safe:
+        print("UNSAFE")
+        return EXIT_UNSAFE
+    if args.trace:
+        trace.save(args.trace)
+
+    if args.save:
+        from banker_render import render_trace
+
+        # Rendered headless on Agg, so saving needs no display.
+        render_trace(trace, args.save, fps=1000 / args.interval)
+        return EXIT_SAFE
+
+    import matplotlib.pyplot as plt
+    from banker_plot import play_trace
+
+    fig, playback = play_trace(trace, 1000 / args.interval)
+    plt.show()
+    return EXIT_SAFE
+
+
+def import_state(args):
+    from banker_import import load_matrix_files, load_state_file
+    from banker_store import open_store
+
+    if args.state:
+        data = load_state_file(args.state)
+    elif args.allocation and args.maximum and args.available:
+        data = load_matrix_files(args.allocation, args.maximum, args.available)
+    else:
+        raise ValueError("Give --state, or all of --allocation, --maximum and --available.")
+
+    open_store(args.store, None).save(args.name, data)
+    print(f"Imported {args.name}: {data['num_processes']} processes, {data['num_resources']} resource types into {args.store}.")
+    return EXIT_SAFE
+
+
+def positive_int(text):
+    value = int(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="banker_cli.py", description="Banker's Algorithm without the GUI.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("check", help="check whether states are safe")
+    p.add_argument("file", help="JSON dataset, JSON store or text file ('-' for stdin)")
+    p.add_argument("--name", help="dataset to pick from a store (default: all)")
+    p.add_argument("--order", choices=ORDERS, default="lowest")
+    p.add_argument("--json", action="store_true", help="print JSON lines")
+    p.add_argument("--cache", nargs="?", const="banker_cache.db", metavar="PATH", help="reuse results from a result cache")
+    p.set_defaults(run=check)
+
+    p = commands.add_parser("request", help="decide a resource request")
+    p.add_argument("file")
+    p.add_argument("--name")
+    p.add_argument("--pid", type=int, required=True)
+    p.add_argument("--vector", required=True, help="requested amounts, e.g. \"1 0 2\"")
+    p.add_argument("--json", action="store_true")
+    p.set_defaults(run=request)
+
+    # Listed for --help only: main() hands everything after "batch" to banker_batch unparsed.
+    commands.add_parser("batch", help="run banker_batch.py (all its options are accepted)", add_help=False)
+
+    p = commands.add_parser("animate", help="show the matplotlib animation of the safe sequence")
+    p.add_argument("file")
+    p.add_argument("--name")
+    p.add_argument("--interval", type=positive_int, default=1500, help="milliseconds per step (playback speed can be changed with +/-)")
+    p.add_argument("--save", help="render the animation headless to this .gif, .mp4 or PNG frame directory instead of showing it")
+    p.add_argument("--trace", help="also write the execution trace here")
+    p.set_defaults(run=animate)
+
+    p = commands.add_parser("import", help="save CSV / TSV / text matrices or a JSON dataset into a store")
+    p.add_argument("--state", help="whole state: sectioned text, blank-line separated blocks or JSON")
+    p.add_argument("--allocation", help="Allocation matrix file")
+    p.add_argument("--maximum", help="Max matrix file")
+    p.add_argument("--available", help="Available vector file")
+    p.add_argument("--store", default="banker_data.db")
+    p.add_argument("--name", required=True)
+    p.set_defaults(run=import_state)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["batch"]:
+        # argparse.REMAINDER drops options that come before the first positional.
+        run, args = batch, argv[1:]
+    else:
+        args = build_parser().parse_args(argv)
+        run = args.run
+    try:
+        return run(args)
+    except (OSError, KeyError, IndexError, ValueError, TypeError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
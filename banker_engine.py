@@ -0,0 +1,280 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Safety check engines shared by the simulators. Importing this module never
+# loads tkinter or matplotlib, and numpy is only imported by the numpy backend.
+#
+# Every engine returns (safe, sequence) where sequence is a list of process
+# indices. bankers_algorithm() picks a backend from the problem size:
+#   "python"   - the original rescan loop, fastest for classroom sized tables
+#   "numpy"    - one broadcast comparison per pass, for big tables or ndarray input
+#   "worklist" - per-resource need queues, O(n*m*log n) whatever the order of the table
+#
+# The order argument picks which safe sequence is reported:
+#   "lowest" - rescan from P0 after every finished process (os_2, os_4..os_8)
+#   "sweep"  - keep scanning forward and only wrap to P0 at the end of a pass (os_1)
+#   "any"    - whatever order is cheapest for the engine
+#
+# Pass cache=banker_cache.default_cache() (or any ResultCache) to answer states
+# that were checked before from disk.
+#
+# Callers that already hold the Need matrix (e.g. MatrixState.need) can pass it
+# as need= so it is not rebuilt from Max on every check. The backends then
+# ignore maximum and it may be None; bankers_algorithm() only reads it for the
+# cache key.
+
+import heapq
+import importlib.util
+from collections import deque
+
+ORDERS = ("lowest", "sweep", "any")
+
+# The python backend rescans every pending row after each finished process,
+# O(n^2 * m) in the worst order, so it only gets tables with few processes.
+# From NUMPY_MIN_CELLS cells on the numpy backend takes over from the worklist.
+PYTHON_MAX_PROCESSES = 16
+PYTHON_MAX_CELLS = 4096
+NUMPY_MIN_CELLS = 100_000
+
+
+def check_order(order):
+    if order not in ORDERS:
+        raise ValueError(f"Unknown order '{order}', expected one of {ORDERS}.")
+
+
+def calculate_need(maximum, allocation):
+    return [[maximum[i][j] - allocation[i][j] for j in range(len(maximum[i]))] for i in range(len(maximum))]
+
+
+def safe_sequence_python(allocation, maximum, available, order="lowest", need=None):
+    check_order(order)
+    n = len(allocation)
+    m = len(available)
+    rows = maximum if need is None else need
+    # Checked like the worklist does, so a ragged table is an error on every backend.
+    if len(rows) != n:
+        raise ValueError("Allocation and Max must have the same number of processes.")
+    if any(len(allocation[i]) != m or len(rows[i]) != m for i in range(n)):
+        raise ValueError("Incorrect number of resource types.")
+    if need is None:
+        need = calculate_need(maximum, allocation)
+    work = list(available)
+    finish = [False] * n
+    sequence = []
+
+    while len(sequence) < n:
+        allocated = False
+        for i in range(n):
+            if not finish[i] and all(need[i][j] <= work[j] for j in range(m)):
+                for j in range(m):
+                    work[j] += allocation[i][j]
+                finish[i] = True
+                sequence.append(i)
+                allocated = True
+                if order != "sweep":
+                    break
+        if not allocated:
+            return False, []
+    return True, sequence
+
+
+def safe_sequence_numpy(allocation, maximum, available, order="lowest", need=None):
+    import numpy as np
+
+    check_order(order)
+    # Signed integer arrays (e.g. memory-mapped snapshots) are used as they are, without a copy.
+    allocation = np.asarray(allocation)
+    if allocation.dtype.kind != "i":
+        allocation = allocation.astype(np.int64)
+    rows = np.asarray(maximum if need is None else need)
+    if rows.dtype.kind != "i":
+        rows = rows.astype(np.int64)
+    work = np.array(available, dtype=np.int64)
+
+    n = allocation.shape[0]
+    if n == 0:
+        return True, []
+    if allocation.shape != rows.shape or allocation.shape[1:] != work.shape:
+        raise ValueError("Incorrect number of resource types.")
+
+    need = rows - allocation if need is None else rows
+    pending = np.ones(n, dtype=bool)
+    # Pending processes known to fit. Work only ever grows, so a process that
+    # fits once keeps fitting.
+    ready = (need <= work).all(axis=1)
+    sequence = []
+    start = 0
+    low = 0  # every process below low has finished
+    # Re-checking blocked rows is quadratic when they pile up in front of the
+    # candidates; past this many compared cells the worklist finishes the job.
+    budget = 4 * need.size
+
+    while len(sequence) < n:
+        if budget < 0:
+            rest = np.flatnonzero(pending)
+            safe, tail = safe_sequence_worklist(allocation[rest].tolist(), None, work.tolist(), order,
+                                                start=int(np.searchsorted(rest, start)), need=need[rest].tolist())
+            return (True, sequence + rest[tail].tolist()) if safe else (False, [])
+
+        while not pending[low]:
+            low += 1
+        begin = max(start, low)
+        pick = n
+        if begin < n:
+            first = begin + int(ready[begin:].argmax())
+            if ready[first]:
+                pick = first
+
+        # Pending processes in front of the first known candidate were blocked
+        # before the last release; check them again with one comparison.
+        blocked = begin + np.flatnonzero(pending[begin:pick])
+        if blocked.size:
+            budget -= need.shape[1] * blocked.size
+            fits = (need[blocked] <= work).all(axis=1)
+            if fits.any():
+                ready[blocked[fits]] = True
+                pick = int(blocked[fits.argmax()])
+
+        if pick == n:
+            if start == 0:
+                return False, []
+            start = 0  # end of a sweep pass, start again from P0
+            continue
+
+        pending[pick] = False
+        ready[pick] = False
+        work += allocation[pick]
+        sequence.append(pick)
+        if order == "sweep":
+            start = pick + 1
+
+    return True, sequence
+
+
+def ready_queue(order, start=0):
+    # Returns push, pop and has_ready for the set of runnable processes.
+    if order == "any":
+        ready = deque()
+        return ready.append, ready.popleft, lambda: bool(ready)
+
+    if order == "lowest":
+        ready = []
+        return (lambda pid: heapq.heappush(ready, pid),
+                lambda: heapq.heappop(ready),
+                lambda: bool(ready))
+
+    # "sweep": processes that become runnable behind the scan position wait for the next pass.
+    this_pass, next_pass = [], []
+    position = start - 1
+
+    def push(pid):
+        heapq.heappush(this_pass if pid > position else next_pass, pid)
+
+    def pop():
+        nonlocal this_pass, next_pass, position
+        if not this_pass:
+            this_pass, next_pass = next_pass, []
+            heapq.heapify(this_pass)
+        position = heapq.heappop(this_pass)
+        return position
+
+    return push, pop, lambda: bool(this_pass or next_pass)
+
+
+def safe_sequence_worklist(allocation, maximum, available, order="lowest", start=0, need=None):
+    # Each resource keeps its processes sorted by need, and every process counts
+    # how many resources it is still blocked on. Releasing a process only walks
+    # the queues forward, so the whole check is O(n*m*log n) instead of
+    # rescanning from P0 after every finished process.
+    # start is where a "sweep" pass is resumed from.
+    check_order(order)
+    n = len(allocation)
+    m = len(available)
+    rows = maximum if need is None else need
+    if len(rows) != n:
+        raise ValueError("Allocation and Max must have the same number of processes.")
+
+    need_columns = [[0] * n for _ in range(m)]
+    for i in range(n):
+        row = rows[i]
+        if len(allocation[i]) != m or len(row) != m:
+            raise ValueError("Incorrect number of resource types.")
+        if need is None:
+            row = [row[j] - allocation[i][j] for j in range(m)]
+        for j in range(m):
+            need_columns[j][i] = row[j]
+    queues = [sorted(range(n), key=column.__getitem__) for column in need_columns]
+    heads = [0] * m
+    blocked = [m] * n
+    work = list(available)
+
+    push, pop, has_ready = ready_queue(order, start)
+
+    def advance(j):
+        queue = queues[j]
+        column = need_columns[j]
+        head = heads[j]
+        while head < n and column[queue[head]] <= work[j]:
+            pid = queue[head]
+            blocked[pid] -= 1
+            if blocked[pid] == 0:
+                push(pid)
+            head += 1
+        heads[j] = head
+
+    if m == 0:
+        for pid in range(n):
+            push(pid)
+    for j in range(m):
+        advance(j)
+
+    sequence = []
+    while len(sequence) < n:
+        if not has_ready():
+            return False, []
+        pid = pop()
+        sequence.append(pid)
+        row = allocation[pid]
+        for j in range(m):
+            if row[j]:
+                work[j] += row[j]
+                advance(j)
+
+    return True, sequence
+
+
+BACKENDS = {
+    "python": safe_sequence_python,
+    "numpy": safe_sequence_numpy,
+    "worklist": safe_sequence_worklist,
+}
+
+numpy_available = None
+
+
+def choose_backend(allocation, available):
+    global numpy_available
+    if numpy_available is None:
+        numpy_available = importlib.util.find_spec("numpy") is not None
+
+    cells = len(allocation) * len(available)
+    if len(allocation) <= PYTHON_MAX_PROCESSES and cells <= PYTHON_MAX_CELLS:
+        return "python"
+    is_array = type(allocation).__module__ == "numpy"
+    if numpy_available and (is_array or cells >= NUMPY_MIN_CELLS):
+        return "numpy"
+    return "worklist"
+
+
+def bankers_algorithm(allocation, maximum, available, order="lowest", backend="auto", cache=None, need=None):
+    if backend == "auto":
+        backend = choose_backend(allocation, available)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {tuple(BACKENDS)} or 'auto'.")
+    if cache is not None:
+        check_order(order)
+        return cache.lookup(allocation, maximum, available, order,
+                            lambda: BACKENDS[backend](allocation, maximum, available, order, need=need))
+    return BACKENDS[backend](allocation, maximum, available, order, need=need)
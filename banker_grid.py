@@ -0,0 +1,421 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Matrix editor for os_6 / os_7 / os_8 that stays fast for huge tables.
+#
+# GridModel keeps the Allocation and Max cells in one numpy array of the
+# smallest integer type that fits (EMPTY marks a cell nobody filled in yet).
+# MatrixGrid draws it on a Canvas: only the rows that fit in the window exist
+# as canvas items, scrolling just rewrites their text, and one floating Entry
+# is moved onto whichever cell is being edited. Building the grid therefore
+# costs the same for 5 processes as for 100000.
+#
+# Every change bumps GridModel.version, so a front-end can tell whether the
+# input changed since its last run. matrix() keeps the int64 array it handed
+# out and builds the next one from it plus the cells set since, without
+# scanning and widening the whole table again. bind_entry() ties a plain
+# Entry to one cell: its text is parsed as it is typed, so running and saving
+# read the model rather than int() every Entry again.
+
+import itertools
+import tkinter as tk
+
+import numpy as np
+
+from banker_matrix import smallest_dtype
+
+EMPTY = -1
+INVALID = "#ffd0d0"  # background of an Entry holding text that is not a count
+
+# Shared by all models, so (model_a.version, model_b.version) identifies a state.
+_versions = itertools.count(1)
+
+
+class GridModel:
+    """Cells of several rows x cols integer matrices ("groups"), stored compactly."""
+
+    def __init__(self, groups, rows, cols):
+        self.groups = tuple(groups)
+        self.values = np.full((len(self.groups), rows, cols), EMPTY, dtype=np.int8)
+        self.changed()
+
+    @property
+    def rows(self):
+        return self.values.shape[1]
+
+    @property
+    def cols(self):
+        return self.values.shape[2]
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def changed(self, group=None, cell=None):
+        """
+        Bumps the version. A cell is remembered as dirty for its group's
+        snapshot; without one the snapshot of group (or of all groups) is dropped.
+        """
+        self.version = next(_versions)
+        if cell is not None:
+            self.dirty[group].add(cell)
+        elif group is not None:
+            self.snapshots[group] = None
+            self.dirty[group] = set()
+        else:
+            self.snapshots = [None] * len(self.groups)
+            self.dirty = [set() for _ in self.groups]
+
+    def widen(self, high):
+        dtype = smallest_dtype(EMPTY, max(high, int(np.iinfo(self.values.dtype).max)))
+        if dtype != self.values.dtype:
+            self.values = self.values.astype(dtype)
+
+    def resize(self, rows, cols):
+        # Cells inside both the old and the new size keep their values.
+        values = np.full((len(self.groups), rows, cols), EMPTY, dtype=self.values.dtype)
+        r, c = min(rows, self.rows), min(cols, self.cols)
+        values[:, :r, :c] = self.values[:, :r, :c]
+        self.values = values
+        self.changed()
+
+    def clear(self):
+        self.values.fill(EMPTY)
+        self.changed()
+
+    def get(self, group, i, j):
+        value = int(self.values[group, i, j])
+        return None if value == EMPTY else value
+
+    def set(self, group, i, j, value):
+        """Sets one cell; None empties it. Setting the value a cell already has is not a change."""
+        if value is not None and value < 0:
+            raise ValueError("Resource counts must not be negative.")
+        if value == self.get(group, i, j):
+            return
+        if value is None:
+            self.values[group, i, j] = EMPTY
+        else:
+            self.widen(value)
+            self.values[group, i, j] = value
+        self.changed(group, (i, j))
+
+    def set_matrix(self, group, matrix):
+        matrix = np.asarray(matrix, dtype=np.int64)
+        if matrix.size == 0:
+            matrix = matrix.reshape(self.rows, self.cols)
+        if matrix.shape != (self.rows, self.cols):
+            raise ValueError(f"{self.groups[group]} must be {self.rows}x{self.cols}.")
+        if matrix.size:
+            if matrix.min() < 0:
+                raise ValueError("Resource counts must not be negative.")
+            self.widen(int(matrix.max()))
+        self.values[group] = matrix
+        self.changed(group)
+
+    def load(self, matrices):
+        """Replaces every group at once; the model takes the size of the matrices."""
+        matrices = [np.asarray(matrix, dtype=np.int64) for matrix in matrices]
+        if len(matrices) != len(self.groups):
+            raise ValueError(f"Expected {len(self.groups)} matrices, got {len(matrices)}.")
+        rows, cols = matrices[0].shape if matrices[0].ndim == 2 else (len(matrices[0]), self.cols)
+        # Filled into a fresh array, so a rejected matrix leaves the model as it was.
+        previous = self.values
+        self.values = np.full((len(self.groups), rows, cols), EMPTY, dtype=previous.dtype)
+        try:
+            for group, matrix in enumerate(matrices):
+                self.set_matrix(group, matrix)
+        except ValueError:
+            self.values = previous
+            raise
+        finally:
+            self.changed()
+
+    def matrix(self, group):
+        """
+        The group as a read-only int64 array; ValueError if any cell is still
+        empty. An array once handed out never changes, so a run may keep
+        reading it while the model is edited and read again.
+        """
+        snapshot, dirty = self.snapshots[group], self.dirty[group]
+        if snapshot is None:
+            values = self.values[group]
+            if (values == EMPTY).any():
+                raise ValueError(f"{self.groups[group]} has empty cells.")
+            snapshot = self.snapshots[group] = values.astype(np.int64)
+        elif dirty:
+            cells = tuple(np.array(list(dirty)).T)
+            patch = self.values[group][cells]
+            if (patch == EMPTY).any():
+                raise ValueError(f"{self.groups[group]} has empty cells.")
+            # A copy, not a patch in place: a worker may still be checking the previous array.
+            snapshot = self.snapshots[group] = snapshot.copy()
+            snapshot[cells] = patch
+            dirty.clear()
+        view = snapshot.view()
+        view.flags.writeable = False
+        return view
+
+    def text(self, group, i, j):
+        value = self.values[group, i, j]
+        return "" if value == EMPTY else str(value)
+
+
+class MatrixGrid(tk.Frame):
+    """
+    Scrollable view of a GridModel with one column block per group. on_edit is
+    called as on_edit(group, i, j, value) after a cell was changed by the user.
+    """
+
+    def __init__(self, master, model, cell_width=44, row_height=22, visible_rows=15, on_edit=None):
+        super().__init__(master)
+        self.model = model
+        self.cell_width = cell_width
+        self.row_height = row_height
+        self.label_width = 56
+        self.group_gap = 16
+        self.on_edit = on_edit
+        self.top = 0
+        self.slots = []
+        self.editing = None
+
+        self.canvas = tk.Canvas(self, height=(visible_rows + 2) * row_height, highlightthickness=0, bg="white")
+        self.vbar = tk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.hbar = tk.Scrollbar(self, orient="horizontal", command=self.canvas.xview)
+        self.canvas.config(xscrollcommand=self.hbar.set)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.vbar.grid(row=0, column=1, sticky="ns")
+        self.hbar.grid(row=1, column=0, sticky="ew")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.editor = tk.Entry(self.canvas, justify="center", relief="solid", borderwidth=1)
+        self.editor_window = self.canvas.create_window(0, 0, window=self.editor, anchor="nw", state="hidden")
+        self.editor.bind("<Return>", lambda e: self.move_editor(1, 0))
+        self.editor.bind("<Down>", lambda e: self.move_editor(1, 0))
+        self.editor.bind("<Up>", lambda e: self.move_editor(-1, 0))
+        self.editor.bind("<Tab>", lambda e: self.move_editor(0, 1))
+        self.editor.bind("<Shift-Tab>", lambda e: self.move_editor(0, -1))
+        self.editor.bind("<Escape>", lambda e: self.hide_editor())
+        self.editor.bind("<FocusOut>", lambda e: self.commit())
+
+        self.canvas.bind("<Configure>", self.resized)
+        self.canvas.bind("<Button-1>", self.click)
+        self.canvas.bind("<MouseWheel>", lambda e: self.yview("scroll", -3 if e.delta > 0 else 3, "units"))
+        self.canvas.bind("<Button-4>", lambda e: self.yview("scroll", -3, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.yview("scroll", 3, "units"))
+
+        self.reshape()
+
+    # Geometry
+
+    def column_x(self, group, j):
+        block = self.model.cols * self.cell_width + self.group_gap
+        return self.label_width + group * block + j * self.cell_width
+
+    def visible_rows(self):
+        height = max(self.canvas.winfo_height(), int(self.canvas.cget("height")))
+        return max(1, height // self.row_height - 2)
+
+    def reshape(self):
+        """Call after the model was resized."""
+        self.canvas.config(width=min(self.column_x(len(self.model.groups), 0), 900))
+        self.layout()
+
+    def load(self, matrices):
+        """
+        Puts whole matrices into the model in one batch and redraws the visible
+        rows once; the canvas items are only rebuilt if the number of columns changed.
+        """
+        self.hide_editor()
+        cols = self.model.cols
+        self.model.load(matrices)
+        if self.model.cols != cols:
+            self.reshape()
+        else:
+            self.top = min(self.top, max(0, self.model.rows - len(self.slots)))
+            self.redraw()
+
+    def resized(self, event):
+        if self.visible_rows() != len(self.slots):
+            self.layout()
+
+    def layout(self):
+        """Creates the header and one slot of canvas items per visible row."""
+        self.commit()
+        self.hide_editor()
+        self.canvas.delete("cell")
+        model = self.model
+        h = self.row_height
+        width = self.column_x(len(model.groups), 0)
+        self.canvas.config(scrollregion=(0, 0, width, (self.visible_rows() + 2) * h))
+
+        for g, title in enumerate(model.groups):
+            x = self.column_x(g, 0)
+            self.canvas.create_text(x + model.cols * self.cell_width / 2, h / 2, text=title,
+                                    font=("Arial", 10, "bold"), tags="cell")
+            for j in range(model.cols):
+                self.canvas.create_text(self.column_x(g, j) + self.cell_width / 2, h * 1.5, text=f"R{j}",
+                                        fill="gray30", tags="cell")
+
+        self.slots = []
+        for s in range(self.visible_rows()):
+            y = (s + 2) * h
+            label = self.canvas.create_text(self.label_width / 2, y + h / 2, tags="cell")
+            cells = []
+            for g in range(len(model.groups)):
+                for j in range(model.cols):
+                    x = self.column_x(g, j)
+                    self.canvas.create_rectangle(x, y, x + self.cell_width, y + h, outline="gray75",
+                                                 tags=("cell", f"slot{s}"))
+                    cells.append(self.canvas.create_text(x + self.cell_width / 2, y + h / 2, tags="cell"))
+            self.slots.append((label, cells))
+
+        self.top = min(self.top, max(0, model.rows - len(self.slots)))
+        self.redraw()
+
+    def redraw(self):
+        model = self.model
+        for s, (label, cells) in enumerate(self.slots):
+            i = self.top + s
+            if i >= model.rows:
+                self.canvas.itemconfig(label, text="")
+                self.canvas.itemconfig(f"slot{s}", state="hidden")
+                for item in cells:
+                    self.canvas.itemconfig(item, text="")
+                continue
+            self.canvas.itemconfig(label, text=f"P{i}")
+            self.canvas.itemconfig(f"slot{s}", state="normal")
+            row = model.values[:, i, :]
+            for item, value in zip(cells, row.reshape(-1).tolist()):
+                self.canvas.itemconfig(item, text="" if value == EMPTY else value)
+        self.update_scrollbar()
+
+    def update_scrollbar(self):
+        rows = max(self.model.rows, 1)
+        self.vbar.set(self.top / rows, min(1.0, (self.top + len(self.slots)) / rows))
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            top = int(float(args[1]) * self.model.rows)
+        elif args[2] == "pages":
+            top = self.top + int(args[1]) * len(self.slots)
+        else:
+            top = self.top + int(args[1])
+        self.scroll_to(top)
+
+    def scroll_to(self, top):
+        top = max(0, min(top, self.model.rows - len(self.slots)))
+        if top != self.top:
+            self.commit()
+            self.hide_editor()
+            self.top = top
+            self.redraw()
+
+    def see(self, i):
+        if i < self.top:
+            self.scroll_to(i)
+        elif i >= self.top + len(self.slots):
+            self.scroll_to(i - len(self.slots) + 1)
+
+    # Editing
+
+    def cell_at(self, x, y):
+        x, y = self.canvas.canvasx(x), self.canvas.canvasy(y)
+        s = int(y // self.row_height) - 2
+        if s < 0 or s >= len(self.slots) or self.top + s >= self.model.rows:
+            return None
+        block = self.model.cols * self.cell_width + self.group_gap
+        g, offset = divmod(x - self.label_width, block)
+        j = int(offset // self.cell_width)
+        if x < self.label_width or g >= len(self.model.groups) or j >= self.model.cols:
+            return None
+        return int(g), self.top + s, j
+
+    def click(self, event):
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.edit(*cell)
+
+    def edit(self, g, i, j):
+        if not self.commit():
+            return
+        self.see(i)
+        self.editing = (g, i, j)
+        y = (i - self.top + 2) * self.row_height
+        self.canvas.coords(self.editor_window, self.column_x(g, j), y)
+        self.canvas.itemconfig(self.editor_window, width=self.cell_width, height=self.row_height, state="normal")
+        self.editor.config(bg="white")
+        self.editor.delete(0, tk.END)
+        self.editor.insert(0, self.model.text(g, i, j))
+        self.editor.select_range(0, tk.END)
+        self.editor.focus_set()
+
+    def commit(self):
+        """Stores the editor's text in its cell; False (and a red editor) if it is not a valid count."""
+        if self.editing is None:
+            return True
+        g, i, j = self.editing
+        text = self.editor.get().strip()
+        try:
+            value = int(text) if text else None
+            if value != self.model.get(g, i, j):
+                self.model.set(g, i, j, value)
+                if self.on_edit:
+                    self.on_edit(g, i, j, value)
+        except ValueError:
+            self.editor.config(bg=INVALID)
+            return False
+        if self.top <= i < self.top + len(self.slots):
+            label, cells = self.slots[i - self.top]
+            self.canvas.itemconfig(cells[g * self.model.cols + j], text=self.model.text(g, i, j))
+        return True
+
+    def flush(self):
+        """Commits the open editor before the model is read; ValueError if its text is not a valid count."""
+        if not self.commit():
+            raise ValueError("The cell being edited does not hold a valid count.")
+
+    def move_editor(self, di, dj):
+        if self.editing is None:
+            return "break"
+        g, i, j = self.editing
+        j += dj
+        if j < 0 and g > 0:
+            g, j = g - 1, self.model.cols - 1
+        elif j >= self.model.cols and g + 1 < len(self.model.groups):
+            g, j = g + 1, 0
+        i = max(0, min(i + di, self.model.rows - 1))
+        j = max(0, min(j, self.model.cols - 1))
+        self.edit(g, i, j)
+        return "break"
+
+    def hide_editor(self):
+        if self.editing is None:
+            return
+        self.editing = None
+        self.canvas.itemconfig(self.editor_window, state="hidden")
+        self.canvas.focus_set()
+
+
+def bind_entry(entry, model, group, i, j):
+    """
+    Keeps one cell of model in step with a plain Entry: the text is parsed on
+    every edit, typed or inserted by code. Text that is not a count empties
+    the cell and turns the Entry red; the edit itself is always let through.
+    """
+    background = entry.cget("bg")
+
+    def edited(text):
+        text = text.strip()
+        try:
+            model.set(group, i, j, int(text) if text else None)
+            entry.config(bg=background)
+        except ValueError:
+            model.set(group, i, j, None)
+            entry.config(bg=INVALID)
+        return True
+
+    entry.config(validate="key", validatecommand=(entry.register(edited), "%P"))
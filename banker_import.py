@@ -0,0 +1,134 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Bulk import of Allocation / Max / Available instead of typing them cell by cell.
+#
+# A matrix is CSV, TSV, semicolon or space separated text with one process per
+# row (a header row such as "A,B,C" or "R0,R1,R2" is skipped). A whole state can be pasted as
+# three blocks separated by blank lines, or under "Allocation", "Max" and
+# "Available" headings:
+#
+#   Allocation
+#   0 1 0
+#   2 0 0
+#   Max
+#   7 5 3
+#   3 2 2
+#   Available
+#   3 3 2
+#
+# JSON datasets are accepted too, including the string-valued bankers_data.json.
+
+import json
+import re
+
+import numpy as np
+
+SEPARATORS = re.compile(r"[,;\t ]+")
+INTEGER = re.compile(r"[+-]?\d+")
+SECTION = re.compile(r"^\s*(allocation|alloc|maximum|max|available|avail)\s*:?\s*$", re.IGNORECASE | re.MULTILINE)
+SECTION_NAMES = {"alloc": "allocation", "max": "maximum", "avail": "available"}
+
+
+def parse_matrix(text, name="Matrix"):
+    """Parses separated integers into an int64 array with one row per non-empty line."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    if lines and not any(INTEGER.fullmatch(field) for field in SEPARATORS.split(lines[0].strip())):
+        lines = lines[1:]  # header row: no field of the first line is an integer
+    if not lines:
+        return np.zeros((0, 0), dtype=np.int64)
+
+    body = SEPARATORS.sub(" ", "\n".join(lines)).strip()
+    widths = {len(line.split()) for line in body.split("\n")}
+    if len(widths) != 1:
+        raise ValueError(f"{name} rows have different lengths: {sorted(widths)}.")
+    width = widths.pop()
+
+    try:
+        values = np.fromstring(body, dtype=np.int64, sep=" ")
+    except ValueError:
+        values = None
+    if values is None or values.size != width * len(lines):
+        raise ValueError(f"{name} must contain only integers.")
+    return values.reshape(len(lines), width)
+
+
+def read_matrix(path, name="Matrix"):
+    with open(path, "r") as f:
+        return parse_matrix(f.read(), name)
+
+
+def parse_state(text):
+    """Splits a pasted state into Allocation, Max and Available, by headings or blank lines."""
+    headings = list(SECTION.finditer(text))
+    if headings:
+        blocks = {}
+        for k, heading in enumerate(headings):
+            end = headings[k + 1].start() if k + 1 < len(headings) else len(text)
+            key = heading.group(1).lower()
+            blocks[SECTION_NAMES.get(key, key)] = text[heading.end():end]
+        missing = {"allocation", "maximum", "available"} - blocks.keys()
+        if missing:
+            raise ValueError(f"Missing section(s): {', '.join(sorted(missing))}.")
+    else:
+        parts = [part for part in re.split(r"\n\s*\n", text.strip()) if part.strip()]
+        if len(parts) != 3:
+            raise ValueError("Expected Allocation, Max and Available separated by blank lines.")
+        blocks = dict(zip(("allocation", "maximum", "available"), parts))
+
+    return build_dataset(parse_matrix(blocks["allocation"], "Allocation"),
+                         parse_matrix(blocks["maximum"], "Max"),
+                         parse_matrix(blocks["available"], "Available").reshape(-1))
+
+
+def state_from_json(data):
+    """Converts a JSON dataset, with int or string values, in one numpy conversion per matrix."""
+    try:
+        allocation = np.array(data["allocation"], dtype=np.int64)
+        maximum = np.array(data["maximum"], dtype=np.int64)
+        available = np.array(data["available"], dtype=np.int64)
+    except KeyError as e:
+        raise ValueError(f"Dataset has no {e.args[0]} entry.")
+    return build_dataset(allocation, maximum, available)
+
+
+def build_dataset(allocation, maximum, available):
+    """Checks the dimensions agree and returns a dataset in the banker_data.json layout."""
+    available = np.asarray(available, dtype=np.int64).reshape(-1)
+    allocation = np.asarray(allocation, dtype=np.int64)
+    maximum = np.asarray(maximum, dtype=np.int64)
+    m = len(available)
+    if allocation.size == 0:
+        allocation = allocation.reshape(0, m)
+    if maximum.size == 0:
+        maximum = maximum.reshape(0, m)
+
+    if allocation.ndim != 2 or allocation.shape[1] != m or maximum.ndim != 2 or maximum.shape[1] != m:
+        raise ValueError("Incorrect number of resource types.")
+    if allocation.shape != maximum.shape:
+        raise ValueError(f"Allocation has {allocation.shape[0]} processes but Max has {maximum.shape[0]}.")
+
+    return {
+        "num_processes": allocation.shape[0],
+        "num_resources": m,
+        "allocation": allocation.tolist(),
+        "maximum": maximum.tolist(),
+        "available": available.tolist()
+    }
+
+
+def load_state_file(path):
+    """Reads a whole state from a JSON dataset or a pasted-text style file."""
+    with open(path, "r") as f:
+        text = f.read()
+    if text.lstrip().startswith("{"):
+        return state_from_json(json.loads(text))
+    return parse_state(text)
+
+
+def load_matrix_files(allocation_path, maximum_path, available_path):
+    return build_dataset(read_matrix(allocation_path, "Allocation"),
+                         read_matrix(maximum_path, "Max"),
+                         read_matrix(available_path, "Available").reshape(-1))
@@ -0,0 +1,111 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+import numpy as np
+
+DTYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def smallest_dtype(low, high):
+    for dtype in DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    raise OverflowError("Resource counts do not fit in 64 bits.")
+
+
+def as_matrix(values, rows, cols, name):
+    matrix = np.array(values, dtype=np.int64)
+    if matrix.size == 0:
+        matrix = matrix.reshape(rows, cols)
+    if matrix.shape != (rows, cols):
+        raise ValueError(f"{name} must be {rows}x{cols}, got {'x'.join(map(str, matrix.shape))}.")
+    return matrix
+
+
+class MatrixState:
+    """
+    Allocation and Need of every process held as two contiguous row-major arrays
+    using the smallest integer type that can hold the Max matrix. Max itself is
+    not stored: it is always allocation + need, so need never has to be rebuilt.
+    """
+
+    def __init__(self, allocation, maximum, available):
+        self.available = np.array(available, dtype=np.int64).reshape(-1)
+        n = len(allocation)
+        m = len(self.available)
+        allocation = as_matrix(allocation, n, m, "Allocation")
+        maximum = as_matrix(maximum, n, m, "Max")
+        need = maximum - allocation
+
+        if (allocation < 0).any() or (self.available < 0).any():
+            raise ValueError("Resource counts must not be negative.")
+        if (need < 0).any():
+            raise ValueError("Allocation exceeds Max for some process.")
+
+        dtype = smallest_dtype(0, int(maximum.max()) if maximum.size else 0)
+        self.allocation = np.ascontiguousarray(allocation, dtype=dtype)
+        self.need = np.ascontiguousarray(need, dtype=dtype)
+
+    @classmethod
+    def from_dataset(cls, data):
+        return cls(data["allocation"], data["maximum"], data["available"])
+
+    def to_dataset(self):
+        return {
+            "num_processes": self.num_processes,
+            "num_resources": self.num_resources,
+            "allocation": self.allocation.tolist(),
+            "maximum": self.maximum.tolist(),
+            "available": self.available.tolist()
+        }
+
+    @property
+    def num_processes(self):
+        return self.allocation.shape[0]
+
+    @property
+    def num_resources(self):
+        return self.allocation.shape[1]
+
+    @property
+    def maximum(self):
+        return self.allocation + self.need
+
+    @property
+    def nbytes(self):
+        return self.allocation.nbytes + self.need.nbytes + self.available.nbytes
+
+    def widen(self, value):
+        # Switch to a bigger integer type when an edited Max no longer fits.
+        dtype = smallest_dtype(0, max(value, int(np.iinfo(self.allocation.dtype).max)))
+        if dtype != self.allocation.dtype:
+            self.allocation = self.allocation.astype(dtype)
+            self.need = self.need.astype(dtype)
+
+    def set_allocation(self, i, j, value):
+        maximum = int(self.allocation[i, j]) + int(self.need[i, j])
+        if not 0 <= value <= maximum:
+            raise ValueError(f"Allocation of P{i} must be between 0 and its Max ({maximum}).")
+        self.allocation[i, j] = value
+        self.need[i, j] = maximum - value
+
+    def set_maximum(self, i, j, value):
+        if value < self.allocation[i, j]:
+            raise ValueError(f"Max of P{i} must not be below its allocation.")
+        self.widen(value)
+        self.need[i, j] = value - self.allocation[i, j]
+
+    def set_available(self, j, value):
+        if value < 0:
+            raise ValueError("Resource counts must not be negative.")
+        self.available[j] = value
+
+    def move(self, pid, vector):
+        # Hands vector from the available pool to process pid (negative to take it back).
+        vector = np.asarray(vector, dtype=np.int64)
+        self.available -= vector
+        self.allocation[pid] += vector
+        self.need[pid] -= vector
@@ -0,0 +1,247 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Pacing of the step-by-step animations, shared by the Tk front-ends and the
+# matplotlib figures. A Playback walks positions 0..length at `rate` steps per
+# second and calls show(position, previous) once per drawn frame (previous is
+# None for the first frame after load()). Steps and frames are decoupled: when
+# several steps fall due before the next frame may be drawn (a high rate, or
+# drawing that takes longer than a step) they are coalesced and show() only
+# sees the latest position, so a 100000 step run draws no more frames than the
+# screen can take.
+#
+#   self.playback = TkPlayback(root, self.show_step)
+#   self.playback.load(len(sequence)); self.playback.play()
+#   playback_controls(root, self.playback).pack()   # pause, step, seek, speed
+#
+#   playback = FigurePlayback(fig, lambda position, previous: update(position), len(trace))
+#   playback.play()   # keys: space, left/right, home/end, +/-
+
+import math
+import time
+
+FRAME_MS = 40  # never draw more often than this (25 frames per second)
+MIN_RATE = 0.1
+MAX_RATE = 100000.0
+
+
+class Playback:
+    """
+    Position, rate and play/pause state of one animation. Subclasses supply the
+    timer: schedule(ms) must call tick() once after ms, unschedule() cancels it.
+    """
+
+    def __init__(self, show, length=0, rate=1.0, frame_ms=FRAME_MS, clock=time.monotonic):
+        self.show = show
+        self.frame_ms = frame_ms
+        self.clock = clock
+        self.playing = False
+        self.set_rate(rate)
+        self.frame_cost = 0.0  # seconds a frame takes to draw, smoothed
+        self.load(length)
+
+    @property
+    def finished(self):
+        return self.position >= self.length
+
+    def load(self, length):
+        """Starts over with a new run of length steps (paused at position 0)."""
+        self.pause()
+        self.length = length
+        self.position = 0
+        self.shown = None
+        self.carry = 0.0  # part of the next step that has already elapsed
+
+    # Controls
+
+    def play(self):
+        if self.finished:
+            self.position = 0
+        self.playing = True
+        self.last = self.clock()
+        self.render()
+        self.reschedule()
+
+    def pause(self):
+        if self.playing:
+            self.advance()
+            self.playing = False
+        self.unschedule()
+
+    def toggle(self):
+        if self.playing:
+            self.pause()
+        else:
+            self.play()
+
+    def step(self, steps=1):
+        self.pause()
+        self.seek(self.position + steps)
+
+    def seek(self, position):
+        self.position = max(0, min(int(position), self.length))
+        self.carry = 0.0
+        self.last = self.clock()
+        self.render()
+        if self.playing:
+            self.reschedule()
+
+    def skip_to_end(self):
+        self.seek(self.length)
+
+    def set_rate(self, rate):
+        """Steps per second; the part of a step already elapsed is kept."""
+        if self.playing:
+            self.advance()
+        self.rate = max(MIN_RATE, min(float(rate), MAX_RATE))
+        if self.playing:
+            self.reschedule()
+
+    # Timer side
+
+    def schedule(self, ms):
+        raise NotImplementedError
+
+    def unschedule(self):
+        raise NotImplementedError
+
+    def present(self):
+        """Pushes what show() drew to the screen, so its cost is measured with the frame."""
+
+    def advance(self):
+        now = self.clock()
+        if self.playing:
+            self.carry += (now - self.last) * self.rate
+            steps = int(self.carry)
+            self.carry -= steps
+            self.position = min(self.position + steps, self.length)
+        self.last = now
+
+    def tick(self):
+        if not self.playing:
+            return
+        self.advance()
+        self.render()
+        self.reschedule()
+
+    def reschedule(self):
+        self.unschedule()
+        if self.finished:
+            self.playing = False
+        elif self.playing:
+            self.schedule(self.delay())
+
+    def delay(self):
+        """
+        Milliseconds until the next frame: when the next step falls due, but no
+        sooner than the frame interval, and never less than a frame takes to
+        draw, so drawing gets at most half of the time and the rest of the
+        steps are coalesced.
+        """
+        until_step = (1.0 - self.carry) / self.rate
+        return max(1, math.ceil(1000 * max(until_step, self.frame_ms / 1000, self.frame_cost)))
+
+    def render(self):
+        if self.position == self.shown:
+            return
+        start = self.clock()
+        previous, self.shown = self.shown, self.position
+        self.show(self.position, previous)
+        self.present()
+        cost = self.clock() - start
+        self.frame_cost = cost if not self.frame_cost else 0.7 * self.frame_cost + 0.3 * cost
+
+
+class TkPlayback(Playback):
+    """Playback timed with widget.after() on the Tk main loop."""
+
+    def __init__(self, widget, show, length=0, **kwargs):
+        self.widget = widget
+        self.job = None
+        super().__init__(show, length, **kwargs)
+
+    def schedule(self, ms):
+        self.job = self.widget.after(ms, self.fire)
+
+    def unschedule(self):
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    def fire(self):
+        self.job = None
+        self.tick()
+
+    def present(self):
+        self.widget.update_idletasks()
+
+
+class FigurePlayback(Playback):
+    """
+    Playback of a matplotlib figure on its canvas timer. Keys: space pauses,
+    left/right step, home/end seek, + and - double or halve the rate. Pass
+    redraw=False when show() puts its artists on screen itself (by blitting).
+    """
+
+    def __init__(self, figure, show, length=0, redraw=True, **kwargs):
+        self.figure = figure
+        self.redraw = redraw
+        self.timer = figure.canvas.new_timer()
+        self.timer.single_shot = True
+        self.timer.add_callback(self.tick)
+        super().__init__(show, length, **kwargs)
+        figure.canvas.mpl_connect("key_press_event", self.key)
+        figure.canvas.mpl_connect("close_event", lambda event: self.pause())
+
+    def schedule(self, ms):
+        self.timer.interval = ms
+        self.timer.start()
+
+    def unschedule(self):
+        self.timer.stop()
+
+    def present(self):
+        if self.redraw:
+            self.figure.canvas.draw()
+
+    def key(self, event):
+        actions = {
+            " ": self.toggle,
+            "right": lambda: self.step(1),
+            "left": lambda: self.step(-1),
+            "home": lambda: self.seek(0),
+            "end": self.skip_to_end,
+            "+": lambda: self.set_rate(self.rate * 2),
+            "-": lambda: self.set_rate(self.rate / 2),
+        }
+        if event.key in actions:
+            actions[event.key]()
+
+
+def playback_controls(master, playback):
+    """A frame of buttons and a speed slider driving playback; the caller places it."""
+    import tkinter as tk
+
+    frame = tk.Frame(master)
+    buttons = (("|<", lambda: playback.seek(0)), ("<", lambda: playback.step(-1)),
+               ("Play/Pause", playback.toggle), (">", lambda: playback.step(1)),
+               (">|", playback.skip_to_end))
+    for text, command in buttons:
+        tk.Button(frame, text=text, command=command).pack(side="left", padx=2)
+
+    # The slider is log10 of the rate: 0.1 to 10000 steps per second.
+    speed = tk.Label(frame, width=14)
+
+    def set_speed(value):
+        playback.set_rate(10 ** float(value))
+        speed.config(text=f"{playback.rate:g} steps/s")
+
+    scale = tk.Scale(frame, from_=-1, to=4, resolution=0.1, orient="horizontal", showvalue=False,
+                     length=120, command=set_speed)
+    scale.set(math.log10(playback.rate))
+    scale.pack(side="left", padx=5)
+    speed.pack(side="left")
+    set_speed(scale.get())
+    return frame
@@ -0,0 +1,142 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+import math
+import matplotlib.pyplot as plt
+import matplotlib.animation as animation
+import numpy as np
+import warnings
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+
+from banker_playback import FigurePlayback
+from banker_trace import Trace
+
+# Suppress specific warning related to missing glyph in the font
+warnings.filterwarnings("ignore", message="Glyph 9989")
+
+MAX_LABELS = 50  # up to this many processes every bar is labelled
+
+
+def animate_sequence(allocation, available, sequence, interval=1500):
+    """
+    Same animation as os_final_matplot.py, built from an already computed safe
+    sequence. Returns the figure and the FuncAnimation (keep a reference to it).
+    """
+    return animate_trace(Trace.from_sequence(allocation, available, sequence), interval)
+
+
+class TraceView:
+    """
+    The bar chart of a Trace, drawn for blitting. The blue bars never change, so
+    they are drawn once into a cached background; a frame only moves the green
+    highlight to the executing process and rewrites the two texts, and its cost
+    does not grow with the number of processes. When there are more processes
+    than the axes are pixels wide, each bar stands for a bin of consecutive processes.
+    A headless view draws on an Agg canvas of its own, outside pyplot, so it
+    needs no display whatever the current backend is.
+    """
+
+    def __init__(self, trace, figsize=(12, 6), dpi=None, headless=False):
+        self.trace = trace
+        n = trace.num_processes
+
+        if headless:
+            self.figure = Figure(figsize=figsize, dpi=dpi)
+            FigureCanvasAgg(self.figure)
+            ax = self.figure.subplots()
+        else:
+            self.figure, ax = plt.subplots(figsize=figsize, dpi=dpi)
+        self.ax = ax
+        ax.set_title("Banker's Algorithm Safe Sequence Simulation", fontsize=14)
+        ax.set_ylim(0, 1)
+
+        self.status_text = ax.text(0.5, 1.15, '', ha='center', transform=ax.transAxes, fontsize=14, animated=True)
+        self.available_text = ax.text(0.5, -0.2, '', ha='center', transform=ax.transAxes, fontsize=12, animated=True)
+        self.figure.tight_layout(pad=5.0)
+
+        width = ax.get_window_extent().width
+        self.bin_size = max(1, math.ceil(n / width))
+        bins = math.ceil(n / self.bin_size)
+        self.bar_width = 0.6 if self.bin_size == 1 else 1.0
+        # One collection for all the bars: a patch per bar costs more to add and draw than the frames do.
+        left = np.arange(bins) - self.bar_width / 2
+        right = left + self.bar_width
+        low, high = np.zeros(bins), np.full(bins, 0.1)
+        corners = [np.column_stack(c) for c in ((left, low), (left, high), (right, high), (right, low))]
+        ax.add_collection(PolyCollection(np.stack(corners, axis=1), facecolors='blue'))
+        ax.set_xlim(-0.5, bins - 0.5)
+        if n <= MAX_LABELS:
+            ax.set_xticks(range(n), [f'P{i}' for i in range(n)])
+        else:
+            ax.xaxis.set_major_locator(MaxNLocator(10, integer=True))
+            ax.xaxis.set_major_formatter(FuncFormatter(lambda x, pos: f'P{int(x) * self.bin_size}'))
+
+        # At least 3 pixels wide, so a single bin stays visible.
+        self.highlight_width = max(self.bar_width, 3 * bins / width)
+        self.highlight = Rectangle((0, 0), self.highlight_width, 0.1, color='green', animated=True, visible=False)
+        ax.add_patch(self.highlight)
+        self.animated = (self.highlight, self.status_text, self.available_text)
+
+        self.background = None
+        self.figure.canvas.mpl_connect("draw_event", self.grab_background)
+
+    def update(self, frame):
+        """Sets the animated artists to frame; frame len(trace) is the completed sequence."""
+        if frame < len(self.trace):
+            pid, work = self.trace.step(frame)
+            self.highlight.set_x(pid // self.bin_size - self.highlight_width / 2)
+            self.highlight.set_visible(True)
+            self.status_text.set_text(f'Executing Process P{pid}')
+            self.available_text.set_text(f'Available: {work.tolist()}')
+        else:
+            self.highlight.set_visible(False)
+            self.status_text.set_text('Safe Sequence Completed ✅')
+            self.available_text.set_text(f'Final Available: {self.trace.available_before(len(self.trace)).tolist()}')
+        return self.animated
+
+    def grab_background(self, event):
+        # A full draw (first show, resize) leaves the animated artists out: keep it as the background.
+        canvas = self.figure.canvas
+        if canvas.supports_blit and not canvas.is_saving():
+            self.background = canvas.copy_from_bbox(self.figure.bbox)
+            self.draw_animated()
+
+    def draw_animated(self):
+        for artist in self.animated:
+            self.figure.draw_artist(artist)
+
+    def show(self, position, previous=None):
+        """Playback callback: redraws only the animated artists over the background."""
+        self.update(position)
+        canvas = self.figure.canvas
+        if self.background is None:
+            canvas.draw()
+            return
+        canvas.restore_region(self.background)
+        self.draw_animated()
+        canvas.blit(self.figure.bbox)
+
+
+def animate_trace(trace, interval=1500):
+    """Every step at a fixed interval, as a FuncAnimation (for saving to a file)."""
+    view = TraceView(trace)
+    ani = animation.FuncAnimation(view.figure, view.update, frames=len(trace) + 1, interval=interval,
+                                  repeat=False, blit=True)
+    return view.figure, ani
+
+
+def play_trace(trace, rate=1.0):
+    """
+    Interactive replay at rate steps per second with pause, step, seek and speed
+    keys (see FigurePlayback). Returns the figure and the playback (keep a reference to it).
+    """
+    view = TraceView(trace)
+    playback = FigurePlayback(view.figure, view.show, len(trace), rate=rate, redraw=False)
+    playback.play()
+    return view.figure, playback
@@ -0,0 +1,209 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Renders the safe sequence animation without a display, for reports and batch
+# jobs:
+#   python banker_render.py banker_data.json --name 5P_3R -o 5P_3R.gif
+#   python banker_render.py 5P_3R.trc -o frames/           # numbered PNG frames
+#   python banker_render.py banker_data.json --all --out-dir renders --format mp4
+#
+# A single animation is split into chunks of frames that are drawn in parallel
+# on a process pool, each on its own Agg figure that only blits the changed
+# artists between frames; --all renders one scenario per worker instead.
+# --max-frames caps the frames per animation (further steps are coalesced,
+# like a fast playback) and --width/--height/--dpi set the resolution.
+# GIFs are written with Pillow, MP4 needs ffmpeg on the PATH.
+
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import matplotlib
+import numpy as np
+from PIL import Image
+
+from banker_batch import chunked, run_batch
+from banker_plot import TraceView
+from banker_store import open_store
+from banker_trace import Trace, record
+
+FORMATS = ("gif", "mp4", "png")
+MAX_FRAMES = 600
+MIN_FRAMES_PER_JOB = 16
+JOBS_PER_WORKER = 4
+FRAME_NAME = "frame_%06d.png"
+PALETTE_COLORS = 64  # the chart has a handful of colours plus anti-aliasing
+
+
+def frame_positions(steps, max_frames=MAX_FRAMES):
+    """Trace positions 0..steps to draw; past max_frames, evenly spaced steps share a frame."""
+    if steps + 1 <= max_frames:
+        return list(range(steps + 1))
+    return np.unique(np.linspace(0, steps, max(max_frames, 2)).round().astype(np.int64)).tolist()
+
+
+def output_format(path):
+    """gif or mp4 by extension; anything else is a directory of PNG frames."""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    return extension if extension in ("gif", "mp4") else "png"
+
+
+def find_ffmpeg():
+    ffmpeg = shutil.which(matplotlib.rcParams["animation.ffmpeg_path"])
+    if ffmpeg is None:
+        raise ValueError("MP4 output needs ffmpeg on the PATH; write a .gif or PNG frames instead.")
+    return ffmpeg
+
+
+def render_chunk(trace_path, positions, first, frame_dir, figsize, dpi, fmt="png"):
+    """
+    Worker: draws the full figure once, then each frame is a blit into the Agg
+    buffer. GIF frames are quantized here, in parallel, to a palette taken from
+    the first frame of the chunk (the frames only differ in the highlight and
+    the texts). Frames that are only kept until ffmpeg has read them are
+    compressed lightly.
+    """
+    view = TraceView(Trace.open(trace_path), figsize, dpi, headless=True)
+    canvas = view.figure.canvas
+    palette = None
+    paths = []
+    for k, position in enumerate(positions, first):
+        view.show(position)
+        image = Image.frombuffer("RGBA", canvas.get_width_height(), canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
+        image = image.convert("RGB")
+        if fmt == "gif":
+            if palette is None:
+                palette = image.quantize(PALETTE_COLORS, method=Image.Quantize.FASTOCTREE)
+            image = image.quantize(palette=palette, dither=Image.Dither.NONE)
+        path = os.path.join(frame_dir, FRAME_NAME % k)
+        image.save(path, compress_level=6 if fmt == "png" else 1)
+        paths.append(path)
+    return paths
+
+
+def write_gif(frames, output, fps):
+    # The frames are already quantized; optimize=False keeps the writer from doing it again.
+    images = (Image.open(path) for path in frames[1:])
+    with Image.open(frames[0]) as first:
+        first.save(output, save_all=True, append_images=images, duration=round(1000 / fps), loop=0,
+                   optimize=False)
+
+
+def write_mp4(ffmpeg, frame_dir, output, fps):
+    # x264 wants even dimensions.
+    subprocess.run([ffmpeg, "-y", "-loglevel", "error", "-framerate", str(fps),
+                    "-i", os.path.join(frame_dir, FRAME_NAME), "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                    "-c:v", "libx264", "-pix_fmt", "yuv420p", output], check=True)
+
+
+def render_trace(trace, output, fps=1.0, width=1200, height=600, dpi=100, max_frames=MAX_FRAMES, workers=None):
+    """
+    Writes the animation of trace to output: an .mp4, a .gif, or otherwise a
+    directory of numbered PNG frames. Returns the number of frames.
+    """
+    fmt = output_format(output)
+    ffmpeg = find_ffmpeg() if fmt == "mp4" else None
+    positions = frame_positions(len(trace), max_frames)
+    workers = workers or os.cpu_count() or 1
+    # Every job builds its own figure, so give each worker a few large jobs rather than many small ones.
+    size = max(MIN_FRAMES_PER_JOB, -(-len(positions) // (JOBS_PER_WORKER * workers)))
+    chunks = list(chunked(positions, size))
+    workers = min(workers, len(chunks))
+    figsize = (width / dpi, height / dpi)
+
+    with tempfile.TemporaryDirectory(prefix="banker_render_") as work:
+        # Workers memory-map the trace instead of each receiving a pickled copy.
+        trace_path = os.path.join(work, "trace.trc")
+        trace.save(trace_path)
+        frame_dir = output if fmt == "png" else work
+        os.makedirs(frame_dir, exist_ok=True)
+
+        jobs = ((render_chunk, (trace_path, chunk, k * size, frame_dir, figsize, dpi, fmt))
+                for k, chunk in enumerate(chunks))
+        frames = list(run_batch(jobs, workers))
+        if fmt == "gif":
+            write_gif(frames, output, fps)
+        elif fmt == "mp4":
+            write_mp4(ffmpeg, frame_dir, output, fps)
+    return len(frames)
+
+
+def render_scenario(name, data, out_dir, fmt, options):
+    start = time.perf_counter()
+    try:
+        trace = record(data["allocation"], data["maximum"], data["available"])
+    except (KeyError, TypeError, ValueError) as e:
+        return [{"name": name, "error": str(e)}]
+    if not trace.safe:
+        return [{"name": name, "safe": False}]
+
+    filename = re.sub(r"[^\w.-]", "_", name)
+    output = os.path.join(out_dir, filename if fmt == "png" else f"{filename}.{fmt}")
+    frames = render_trace(trace, output, workers=1, **options)
+    return [{"name": name, "safe": True, "output": output, "frames": frames,
+             "seconds": time.perf_counter() - start}]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the Banker's Algorithm animation without a display.")
+    parser.add_argument("source", help="dataset store (.json or SQLite) or recorded trace (.trc)")
+    parser.add_argument("--name", help="dataset to render from the store")
+    parser.add_argument("-o", "--output", help=".mp4, .gif, or a directory for PNG frames")
+    parser.add_argument("--all", action="store_true", help="render every dataset in the store into --out-dir")
+    parser.add_argument("--out-dir", default="renders")
+    parser.add_argument("--format", choices=FORMATS, default="gif", help="file type for --all (default: %(default)s)")
+    parser.add_argument("--fps", type=float, default=1.0)
+    parser.add_argument("--width", type=int, default=1200, help="pixels (default: %(default)s)")
+    parser.add_argument("--height", type=int, default=600, help="pixels (default: %(default)s)")
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument("--max-frames", type=int, default=MAX_FRAMES, help="frames per animation (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+
+    options = {"fps": args.fps, "width": args.width, "height": args.height, "dpi": args.dpi,
+               "max_frames": args.max_frames}
+    mp4 = args.format == "mp4" if args.all else bool(args.output) and output_format(args.output) == "mp4"
+    if mp4:
+        try:
+            find_ffmpeg()
+        except ValueError as e:
+            raise SystemExit(str(e))
+
+    if args.all:
+        os.makedirs(args.out_dir, exist_ok=True)
+        jobs = ((render_scenario, (name, data, args.out_dir, args.format, options))
+                for name, data in open_store(args.source, None).items())
+        for result in run_batch(jobs, args.workers):
+            print(json.dumps(result))
+        return 0
+
+    if args.source.endswith(".trc"):
+        trace = Trace.open(args.source)
+    else:
+        if not args.name:
+            raise SystemExit("Give --name to render one dataset, or --all.")
+        data = open_store(args.source, None).load(args.name)
+        if data is None:
+            raise SystemExit(f"Dataset '{args.name}' not found in {args.source}.")
+        trace = record(data["allocation"], data["maximum"], data["available"])
+    if not trace.safe:
+        print("UNSAFE")
+        return 1
+
+    output = args.output or f"{args.name or os.path.splitext(os.path.basename(args.source))[0]}.gif"
+    start = time.perf_counter()
+    frames = render_trace(trace, output, workers=args.workers, **options)
+    print(f"Rendered {frames} frames to {output} in {time.perf_counter() - start:.2f} s.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Binary snapshots for states too big for JSON:
+#   python banker_snapshot.py export banker_data.json 5P_3R 5P_3R.bnk
+#   python banker_snapshot.py import 5P_3R.bnk banker_data.db 5P_3R_copy
+#   python banker_snapshot.py check 5P_3R.bnk
+#   python banker_snapshot.py export banker_data.json 5P_3R 5P_3R.bnk.xz
+#
+# Layout (little endian): a 64 byte header
+#   magic "BNKRSNAP", version u32, dtype string (8 bytes, e.g. "<i1"), n u64, m u64
+# followed by the Allocation block (n*m), the Max block (n*m) and Available (m
+# int64), each starting on a 64 byte boundary. The blocks are opened with
+# numpy.memmap, so nothing is read until it is used.
+#
+# A snapshot named *.bnk.gz or *.bnk.xz is the same layout compressed with gzip /
+# lzma. It cannot be memory-mapped: the blocks are decompressed straight into
+# their arrays, without holding the compressed or raw file in memory as well.
+
+import argparse
+import struct
+import sys
+
+import numpy as np
+
+from banker_engine import bankers_algorithm
+from banker_matrix import as_matrix, smallest_dtype
+from banker_store import codec_for, open_file, open_store
+
+MAGIC = b"BNKRSNAP"
+VERSION = 1
+HEADER = struct.Struct("<8sI8sQQ")
+HEADER_SIZE = 64
+ALIGN = 64
+
+
+def aligned(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def block_offsets(n, m, dtype):
+    allocation = HEADER_SIZE
+    maximum = aligned(allocation + n * m * dtype.itemsize)
+    available = aligned(maximum + n * m * dtype.itemsize)
+    return allocation, maximum, available, available + m * 8
+
+
+def write_snapshot(path, allocation, maximum, available, dtype=None):
+    available = np.array(available, dtype=np.int64).reshape(-1)
+    n, m = len(allocation), len(available)
+    allocation = as_matrix(allocation, n, m, "Allocation")
+    maximum = as_matrix(maximum, n, m, "Max")
+    if dtype is None:
+        values = [0]
+        if allocation.size:
+            values += [int(allocation.min()), int(maximum.min()), int(maximum.max()), int(allocation.max())]
+        dtype = smallest_dtype(min(values), max(values))
+    dtype = np.dtype(dtype).newbyteorder("<")
+
+    offsets = block_offsets(n, m, dtype)
+    with open_file(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, dtype.str.encode("ascii"), n, m).ljust(HEADER_SIZE, b"\0"))
+        position = HEADER_SIZE
+        for offset, block in zip(offsets, (allocation.astype(dtype), maximum.astype(dtype), available)):
+            # Pad instead of seeking; compressed streams only write forwards.
+            f.write(b"\0" * (offset - position))
+            f.write(np.ascontiguousarray(block).reshape(-1).view(np.uint8))
+            position = offset + block.nbytes
+
+
+class Snapshot:
+    """
+    A snapshot file mapped into memory; allocation, maximum and available are
+    numpy memmaps (plain arrays for a compressed snapshot).
+    """
+
+    def __init__(self, path, mode="r"):
+        self.path = path
+        self.codec = codec_for(path)
+        if self.codec and mode != "r":
+            raise ValueError(f"{path} is compressed and can only be opened read-only.")
+        with open_file(path, "rb") as f:
+            magic, version, dtype, n, m = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a Banker's Algorithm snapshot.")
+        if version != VERSION:
+            raise ValueError(f"{path} has snapshot version {version}, expected {VERSION}.")
+
+        self.dtype = np.dtype(dtype.rstrip(b"\0").decode("ascii"))
+        self.num_processes = n
+        self.num_resources = m
+        offsets = block_offsets(n, m, self.dtype)
+        if self.codec:
+            self.allocation, self.maximum, self.available = self.read_blocks(offsets, n, m)
+            return
+        self.allocation = self.block(mode, self.dtype, offsets[0], (n, m))
+        self.maximum = self.block(mode, self.dtype, offsets[1], (n, m))
+        self.available = self.block(mode, np.dtype("<i8"), offsets[2], (m,))
+
+    def read_blocks(self, offsets, n, m):
+        blocks = []
+        with open_file(self.path, "rb") as f:
+            position = 0
+            for offset, dtype, shape in zip(offsets, (self.dtype, self.dtype, np.dtype("<i8")), ((n, m), (n, m), (m,))):
+                f.seek(offset - position, 1)  # forward seeks just decompress and discard the padding
+                block = np.empty(shape, dtype=dtype)
+                view = memoryview(block.reshape(-1).view(np.uint8))
+                filled = 0
+                while filled < block.nbytes:
+                    count = f.readinto(view[filled:])
+                    if not count:
+                        raise ValueError(f"{self.path} is truncated.")
+                    filled += count
+                position = offset + block.nbytes
+                blocks.append(block)
+        return blocks
+
+    def block(self, mode, dtype, offset, shape):
+        if 0 in shape:
+            return np.zeros(shape, dtype=dtype)
+        return np.memmap(self.path, dtype=dtype, mode=mode, offset=offset, shape=shape)
+
+    def to_dataset(self):
+        return {
+            "num_processes": self.num_processes,
+            "num_resources": self.num_resources,
+            "allocation": self.allocation.tolist(),
+            "maximum": self.maximum.tolist(),
+            "available": self.available.tolist()
+        }
+
+    def check(self, order="lowest"):
+        return bankers_algorithm(self.allocation, self.maximum, self.available, order)
+
+
+def dataset_to_snapshot(data, path):
+    write_snapshot(path, data["allocation"], data["maximum"], data["available"])
+
+
+def export_snapshot(store_path, name, path):
+    data = open_store(store_path, None).load(name)
+    if data is None:
+        raise KeyError(f"Dataset '{name}' not found in {store_path}.")
+    dataset_to_snapshot(data, path)
+
+
+def import_snapshot(path, store_path, name):
+    open_store(store_path, None).save(name, Snapshot(path).to_dataset())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert and check binary Banker's Algorithm snapshots.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    p = commands.add_parser("export", help="write a stored dataset to a snapshot")
+    p.add_argument("store")
+    p.add_argument("name")
+    p.add_argument("snapshot")
+    p = commands.add_parser("import", help="save a snapshot as a dataset in a store")
+    p.add_argument("snapshot")
+    p.add_argument("store")
+    p.add_argument("name")
+    p = commands.add_parser("check", help="run the safety check on a snapshot")
+    p.add_argument("snapshot")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        export_snapshot(args.store, args.name, args.snapshot)
+    elif args.command == "import":
+        import_snapshot(args.snapshot, args.store, args.name)
+    else:
+        safe, sequence = Snapshot(args.snapshot).check()
+        if safe:
+            print("SAFE " + ' -> '.join(f'P{p}' for p in sequence))
+        else:
+            print("UNSAFE")
+        return 0 if safe else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
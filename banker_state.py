@@ -0,0 +1,168 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+import json
+import math
+
+import numpy as np
+
+from banker_engine import safe_sequence_worklist
+from banker_matrix import MatrixState
+
+DATA_FILE = "banker_data.json"
+
+
+class SlackBlocks:
+    """
+    Slack of every step of the current safe sequence (work before the step minus
+    the need of the process run at that step), split into blocks of about sqrt(n)
+    rows so a prefix can be shifted or searched for its minimum without touching
+    every row.
+    """
+
+    def __init__(self, slack):
+        self.rows = slack
+        n = len(slack)
+        self.size = max(1, math.isqrt(n))
+        starts = np.arange(0, n, self.size)
+        self.add = np.zeros((len(starts), slack.shape[1]), dtype=slack.dtype)
+        if n:
+            self.mins = np.minimum.reduceat(slack, starts, axis=0)
+        else:
+            self.mins = self.add.copy()
+
+    def prefix_min(self, k):
+        full, part = divmod(k, self.size)
+        result = np.full(self.rows.shape[1], np.iinfo(self.rows.dtype).max, dtype=self.rows.dtype)
+        if full:
+            result = self.mins[:full].min(axis=0)
+        if part:
+            start = full * self.size
+            result = np.minimum(result, self.rows[start:start + part].min(axis=0) + self.add[full])
+        return result
+
+    def add_prefix(self, k, vector):
+        full, part = divmod(k, self.size)
+        self.add[:full] += vector
+        self.mins[:full] += vector
+        if part:
+            start = full * self.size
+            self.rows[start:start + part] += vector
+            self.mins[full] = self.rows[start:start + self.size].min(axis=0) + self.add[full]
+
+
+class BankerState:
+    """
+    Allocation state that answers resource requests one at a time.
+
+    need and available are updated in place in a compact MatrixState. A grant is
+    first validated against the safe sequence found last time; the full safety
+    check only runs when that sequence no longer works.
+    """
+
+    def __init__(self, allocation, maximum, available):
+        self.matrix = MatrixState(allocation, maximum, available)
+        self.sequence = None
+        self.position = None
+        self.slack = None
+        self.refresh()
+
+    @classmethod
+    def from_dataset(cls, data):
+        return cls(data["allocation"], data["maximum"], data["available"])
+
+    @classmethod
+    def from_file(cls, name, path=DATA_FILE):
+        with open(path, "r") as f:
+            all_data = json.load(f)
+        if name not in all_data:
+            raise KeyError(f"Dataset '{name}' not found in {path}.")
+        return cls.from_dataset(all_data[name])
+
+    @property
+    def allocation(self):
+        return self.matrix.allocation
+
+    @property
+    def need(self):
+        return self.matrix.need
+
+    @property
+    def available(self):
+        return self.matrix.available
+
+    def is_safe(self):
+        return self.sequence is not None
+
+    def refresh(self):
+        # Full safety check; rebuilds the safe sequence and its slack.
+        safe, sequence = safe_sequence_worklist(self.allocation.tolist(), None, self.available.tolist(),
+                                                order="any", need=self.need.tolist())
+        if not safe:
+            self.sequence = self.position = self.slack = None
+            return False
+
+        order = np.array(sequence, dtype=np.intp)
+        released = self.allocation[order]
+        work = np.cumsum(released, axis=0) - released + self.available
+
+        self.sequence = sequence
+        self.position = np.empty(len(order), dtype=np.intp)
+        self.position[order] = np.arange(len(order))
+        self.slack = SlackBlocks(work - self.need[order])
+        return True
+
+    def request(self, pid, vector):
+        """Grant vector to process pid if the system stays safe. Returns True if granted."""
+        self.check_pid(pid)
+        vector = self.check_vector(vector)
+        if (vector > self.need[pid]).any():
+            raise ValueError(f"P{pid} has exceeded its maximum claim.")
+        if (vector > self.available).any():
+            return False
+
+        self.matrix.move(pid, vector)
+
+        # Steps before pid now start with less work; steps from pid on are unchanged.
+        if self.sequence is not None:
+            k = self.position[pid]
+            if (self.slack.prefix_min(k) >= vector).all():
+                self.slack.add_prefix(k, -vector)
+                return True
+
+        previous = (self.sequence, self.position, self.slack)
+        if self.refresh():
+            return True
+
+        self.matrix.move(pid, -vector)
+        self.sequence, self.position, self.slack = previous
+        return False
+
+    def release(self, pid, vector):
+        """Return vector from process pid to the available pool."""
+        self.check_pid(pid)
+        vector = self.check_vector(vector)
+        if (vector > self.allocation[pid]).any():
+            raise ValueError(f"P{pid} cannot release more than it holds.")
+
+        self.matrix.move(pid, -vector)
+
+        if self.sequence is not None:
+            self.slack.add_prefix(self.position[pid], vector)
+        else:
+            self.refresh()
+
+    def check_pid(self, pid):
+        # numpy would take a negative pid as counting from the end.
+        if not 0 <= pid < len(self.allocation):
+            raise ValueError(f"P{pid} does not exist; processes are P0 to P{len(self.allocation) - 1}.")
+
+    def check_vector(self, vector):
+        vector = np.asarray(vector, dtype=np.int64)
+        if vector.shape != self.available.shape:
+            raise ValueError("Incorrect number of resource types.")
+        if (vector < 0).any():
+            raise ValueError("Resource counts must not be negative.")
+        return vector
@@ -0,0 +1,514 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Dataset stores used by the GUIs. SqliteStore keeps one row per dataset so
+# saving, loading and listing touch only what they need; JsonStore is the old
+# banker_data.json layout. Move an old file over with:
+#   python banker_store.py migrate banker_data.json banker_data.db
+# or compress it with:
+#   python banker_store.py migrate banker_data.json banker_data.json.xz
+#
+# Several simulators may share one store. SQLite does its own locking; JsonStore
+# replaces the file atomically (temporary file + rename) under an fcntl lock on
+# "<file>.lock", and savers that arrive while another one is rewriting leave
+# their change in "<file>.pending" so the next lock holder writes them all at once.
+#
+# A JSON store named *.json.gz or *.json.xz is compressed with gzip / lzma and
+# decompressed as it is streamed, so loading one dataset never inflates the
+# whole file.
+
+# gzip, lzma, sqlite3 and tempfile are imported where they are used, so reading
+# a plain JSON file (banker_cli.py check) does not pay for them at startup.
+
+import argparse
+import importlib
+import json
+import os
+import re
+from collections import OrderedDict
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes are still atomic
+    fcntl = None
+
+DATA_FILE = "banker_data.json"
+STORE_FILE = "banker_data.db"
+
+CODECS = {".gz": "gzip", ".xz": "lzma"}
+# gzip.open defaults to level 9, which is several times slower than 6 for a few percent.
+WRITE_OPTIONS = {"gzip": {"compresslevel": 6}, "lzma": {}}
+JSON_SUFFIXES = (".json", ".json.gz", ".json.xz")
+
+STRUCTURAL = re.compile(r'["{}\[\]]')
+STRING_REST = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+def codec_for(path):
+    """The gzip or lzma module for a compressed file name, None for a plain file."""
+    for suffix, codec in CODECS.items():
+        if path.endswith(suffix):
+            return importlib.import_module(codec)
+    return None
+
+
+def open_file(path, mode="r"):
+    """open() that compresses / decompresses by file name; text modes stay text."""
+    codec = codec_for(path)
+    if codec is None:
+        return open(path, mode)
+    if "b" not in mode:
+        mode += "t"
+    if "r" in mode:
+        return codec.open(path, mode)
+    return codec.open(path, mode, **WRITE_OPTIONS[codec.__name__])
+
+
+@contextmanager
+def file_lock(path):
+    """Holds an exclusive advisory lock on path (created if missing) for the with block."""
+    with open(path, "a") as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def atomic_write(path, text):
+    """
+    Writes text (compressed if the name asks for it) next to path and renames it
+    over path, so readers see the old or the new file, never half of one.
+    """
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    codec = codec_for(path)
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            if codec:
+                with codec.open(raw, "wt", **WRITE_OPTIONS[codec.__name__]) as f:
+                    f.write(text)
+            else:
+                raw.write(text.encode())
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class JsonStreamReader:
+    """
+    Walks the top-level object of a JSON store a chunk at a time, so one dataset
+    can be decoded (or skipped without building it) while memory only holds the
+    dataset being read.
+    """
+
+    def __init__(self, f, chunk_size=1 << 16):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        # Reads at least as much as is still buffered, so retrying a long value stays linear.
+        if self.eof:
+            return False
+        data = self.f.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars):
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"Invalid dataset file: expected one of {chars!r}, found {ch or 'end of file'!r}.")
+        self.pos += 1
+        return ch
+
+    def decode(self):
+        self.peek()
+        decoder = json.JSONDecoder()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+                # A number cut off by the end of the buffer may continue in the next chunk.
+                if self.eof or end < len(self.buf) and self.buf[end] not in "0123456789.eE+-":
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+    def skip(self):
+        if self.peek() not in ("{", "["):
+            self.decode()
+            return
+        depth = 0
+        while True:
+            match = STRUCTURAL.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self.fill():
+                    raise ValueError("Invalid dataset file: unexpected end of file.")
+                continue
+            self.pos = match.end()
+            ch = match.group()
+            if ch == '"':
+                self.skip_string()
+            elif ch in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def skip_string(self):
+        while True:
+            match = STRING_REST.match(self.buf, self.pos)
+            if match:
+                self.pos = match.end()
+                return
+            if not self.fill():
+                raise ValueError("Invalid dataset file: unterminated string.")
+
+    def keys(self):
+        """Yields each dataset name; the caller must decode() or skip() its value before continuing."""
+        self.expect("{")
+        if self.peek() == "}":
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            yield key
+            if self.expect(",}") == "}":
+                return
+
+
+def stream_datasets(f):
+    reader = JsonStreamReader(f)
+    for name in reader.keys():
+        yield name, reader.decode()
+
+
+def stream_load(f, name):
+    reader = JsonStreamReader(f)
+    for key in reader.keys():
+        if key == name:
+            return reader.decode()
+        reader.skip()
+    return None
+
+
+def stream_names(f):
+    reader = JsonStreamReader(f)
+    names = []
+    for key in reader.keys():
+        names.append(key)
+        reader.skip()
+    return names
+
+
+class JsonStore:
+    """
+    The original single JSON file holding every dataset. Reads stream through
+    the file; saving still rewrites all of it, but concurrent saves share one
+    rewrite.
+    """
+
+    def __init__(self, path=DATA_FILE):
+        self.path = path
+        self.lock_path = path + ".lock"
+        self.pending_path = path + ".pending"
+        self.pending_lock_path = path + ".pending.lock"
+
+    def read_all(self):
+        if not os.path.exists(self.path):
+            return {}
+        with open_file(self.path) as f:
+            return json.load(f)
+
+    def names(self):
+        if not os.path.exists(self.path):
+            return []
+        with open_file(self.path) as f:
+            return stream_names(f)
+
+    def load(self, name):
+        if not os.path.exists(self.path):
+            return None
+        with open_file(self.path) as f:
+            return stream_load(f, name)
+
+    def items(self):
+        if not os.path.exists(self.path):
+            return
+        with open_file(self.path) as f:
+            yield from stream_datasets(f)
+
+    def save(self, name, data):
+        self.save_many([(name, data)])
+
+    def save_many(self, items):
+        self.commit([{"name": name, "data": data} for name, data in items])
+
+    def delete(self, name):
+        self.commit([{"name": name, "delete": True}])
+
+    def commit(self, changes):
+        """
+        Queues the changes in the pending file, then takes the store lock and
+        folds every queued change into one rewrite. If another saver already
+        wrote ours while we waited for the lock, there is nothing left to do.
+        """
+        lines = "".join(json.dumps(change, separators=(",", ":")) + "\n" for change in changes)
+        with file_lock(self.pending_lock_path):
+            with open(self.pending_path, "a+") as f:
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != "\n":
+                        lines = "\n" + lines  # keep our change off a line torn by a crashed saver
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+        with file_lock(self.lock_path):
+            self.flush_pending()
+
+    def read_pending(self):
+        try:
+            with open(self.pending_path, "r") as f:
+                return f.read()
+        except FileNotFoundError:
+            return ""
+
+    def flush_pending(self):
+        # Called with the store lock held. The pending file is only locked while
+        # it is read and trimmed, so other savers keep queueing during the rewrite;
+        # changes stay queued until the new store file is in place, and replaying
+        # them after a crash gives the same result.
+        with file_lock(self.pending_lock_path):
+            queued = self.read_pending()
+        if not queued:
+            return
+
+        all_data = self.read_all()
+        for line in queued.splitlines():
+            try:
+                change = json.loads(line)
+            except ValueError:
+                continue  # a saver died half way through its line
+            if change.get("delete"):
+                all_data.pop(change["name"], None)
+            else:
+                all_data[change["name"]] = change["data"]
+        atomic_write(self.path, json.dumps(all_data, indent=2))
+
+        with file_lock(self.pending_lock_path):
+            atomic_write(self.pending_path, self.read_pending()[len(queued):])
+
+
+class SqliteStore:
+    """One row per dataset, looked up by name through the primary key."""
+
+    def __init__(self, path=STORE_FILE):
+        import sqlite3
+
+        self.path = path
+        # WAL lets readers carry on while another simulator writes; writers wait
+        # up to the timeout for each other instead of failing with "database is locked".
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS datasets (
+                name TEXT PRIMARY KEY,
+                num_processes INTEGER NOT NULL,
+                num_resources INTEGER NOT NULL,
+                body TEXT NOT NULL
+            )""")
+        self.db.commit()
+
+    def names(self):
+        return [row[0] for row in self.db.execute("SELECT name FROM datasets ORDER BY rowid")]
+
+    def load(self, name):
+        row = self.db.execute("SELECT body FROM datasets WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def items(self):
+        for name, body in self.db.execute("SELECT name, body FROM datasets ORDER BY rowid"):
+            yield name, json.loads(body)
+
+    def save(self, name, data):
+        self.save_many([(name, data)])
+
+    def save_many(self, items):
+        rows = ((name, len(data["allocation"]), len(data["available"]), json.dumps(data, separators=(",", ":")))
+                for name, data in items)
+        with self.db:
+            self.db.executemany("""
+                INSERT INTO datasets (name, num_processes, num_resources, body) VALUES (?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    num_processes = excluded.num_processes,
+                    num_resources = excluded.num_resources,
+                    body = excluded.body""", rows)
+
+    def delete(self, name):
+        with self.db:
+            self.db.execute("DELETE FROM datasets WHERE name = ?", (name,))
+
+    def data_version(self):
+        """Changes whenever another connection committed, even if only its WAL file was written."""
+        return self.db.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self):
+        self.db.close()
+
+
+class CachedStore:
+    """
+    Keeps the dataset names and the most recently used datasets of a store in
+    memory. The cache is dropped whenever another simulator saved to the store:
+    for SQLite when its data_version changes (commits in WAL mode leave the
+    database file alone), otherwise when the file's modification time or size
+    changes. Loaded datasets are shared with the cache, so callers must not
+    modify them.
+    """
+
+    def __init__(self, store, max_datasets=128):
+        self.store = store
+        self.path = store.path
+        self.max_datasets = max_datasets
+        self.datasets = OrderedDict()
+        self.name_list = None
+        self.signature = self.file_signature()
+
+    def file_signature(self):
+        if isinstance(self.store, SqliteStore):
+            return self.store.data_version()
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def check(self):
+        signature = self.file_signature()
+        if signature != self.signature:
+            self.datasets.clear()
+            self.name_list = None
+            self.signature = signature
+
+    def remember(self, name, data):
+        self.datasets[name] = data
+        self.datasets.move_to_end(name)
+        while len(self.datasets) > self.max_datasets:
+            self.datasets.popitem(last=False)
+
+    def names(self):
+        self.check()
+        if self.name_list is None:
+            self.name_list = self.store.names()
+        return list(self.name_list)
+
+    def load(self, name):
+        self.check()
+        if name in self.datasets:
+            self.datasets.move_to_end(name)
+            return self.datasets[name]
+        data = self.store.load(name)
+        if data is not None:
+            self.remember(name, data)
+        return data
+
+    def items(self):
+        return self.store.items()
+
+    def save(self, name, data):
+        self.check()
+        self.store.save(name, data)
+        # Our own write changes the file; keep what we know instead of re-reading it.
+        self.signature = self.file_signature()
+        self.remember(name, data)
+        if self.name_list is not None and name not in self.name_list:
+            self.name_list.append(name)
+
+    def delete(self, name):
+        self.check()
+        self.store.delete(name)
+        self.signature = self.file_signature()
+        self.datasets.pop(name, None)
+        if self.name_list is not None and name in self.name_list:
+            self.name_list.remove(name)
+
+
+def migrate(json_path=DATA_FILE, store_path=STORE_FILE):
+    """
+    Copies every dataset from an old JSON file into a SQLite store, or into a
+    (compressed) JSON store. Returns how many were copied.
+    """
+    all_data = JsonStore(json_path).read_all()
+    if store_path.endswith(JSON_SUFFIXES):
+        JsonStore(store_path).save_many(all_data.items())
+        return len(all_data)
+    store = SqliteStore(store_path)
+    store.save_many(all_data.items())
+    store.close()
+    return len(all_data)
+
+
+def open_store(path=STORE_FILE, legacy_path=DATA_FILE):
+    """
+    Opens a dataset store by file type (.json, .json.gz and .json.xz files are a
+    JsonStore). A new SQLite store is seeded from the old JSON file the first
+    time it is created.
+    """
+    if path.endswith(JSON_SUFFIXES):
+        return JsonStore(path)
+    if not os.path.exists(path) and legacy_path and os.path.exists(legacy_path):
+        migrate(legacy_path, path)
+    return SqliteStore(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage Banker's Algorithm dataset stores.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    p = commands.add_parser("migrate", help="copy a JSON dataset file into a SQLite or compressed JSON store")
+    p.add_argument("source", nargs="?", default=DATA_FILE)
+    p.add_argument("target", nargs="?", default=STORE_FILE)
+    p = commands.add_parser("list", help="list the datasets in a store")
+    p.add_argument("store", nargs="?", default=STORE_FILE)
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        count = migrate(args.source, args.target)
+        print(f"Migrated {count} datasets from {args.source} to {args.target}.")
+    else:
+        for name in open_store(args.store, None).names():
+            print(name)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Execution traces: which process finished at each step of the safe sequence
+# and the Available (work) vector right after it released its resources. The
+# front-ends replay a trace instead of re-adding allocations frame by frame,
+# and any step can be looked up directly:
+#   python banker_trace.py record banker_data.json 5P_3R 5P_3R.trc
+#   python banker_trace.py show 5P_3R.trc --step 2
+#
+# File layout (little endian): a 64 byte header
+#   magic "BNKRTRCE", version u32, safe u32, work dtype (8 bytes), n u64, m u64, steps u64
+# then, each on a 64 byte boundary, the initial Available (m int64), the pids
+# (steps uint32) and the work vectors (steps x m, smallest dtype that fits).
+# Opened traces are memory-mapped, so step k of a long run costs one row read.
+
+import argparse
+import struct
+import sys
+
+import numpy as np
+
+from banker_engine import bankers_algorithm
+from banker_matrix import smallest_dtype
+from banker_store import open_store
+
+MAGIC = b"BNKRTRCE"
+VERSION = 1
+HEADER = struct.Struct("<8sII8sQQQ")
+HEADER_SIZE = 64
+ALIGN = 64
+
+
+def aligned(offset):
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+def block_offsets(m, steps, dtype):
+    available = HEADER_SIZE
+    pids = aligned(available + m * 8)
+    work = aligned(pids + steps * 4)
+    return available, pids, work, work + steps * m * dtype.itemsize
+
+
+class Trace:
+    """
+    A recorded run. pids[k] finished at step k, leaving work[k] available;
+    before the first step the system had available.
+    """
+
+    def __init__(self, available, pids, work, safe=True, num_processes=None):
+        self.available = available
+        self.pids = pids
+        self.work = work
+        self.safe = safe
+        self.num_processes = len(pids) if num_processes is None else num_processes
+        self.num_resources = len(available)
+
+    def __len__(self):
+        return len(self.pids)
+
+    def step(self, k):
+        """(pid, work after it released) for step k; negative k counts from the end."""
+        return int(self.pids[k]), self.work[k]
+
+    def available_before(self, k):
+        return self.available if k == 0 else self.work[k - 1]
+
+    @property
+    def sequence(self):
+        return self.pids.tolist()
+
+    @classmethod
+    def from_sequence(cls, allocation, available, sequence, safe=True):
+        """Builds the work vectors of a finished run with one cumulative sum."""
+        available = np.array(available, dtype=np.int64).reshape(-1)
+        pids = np.array(sequence, dtype=np.uint32).reshape(-1)
+        released = np.asarray(allocation)[pids].astype(np.int64).reshape(len(pids), len(available))
+        work = np.cumsum(released, axis=0) + available
+        if len(work):
+            dtype = smallest_dtype(min(0, int(work.min()), int(available.min())), max(int(work.max()), int(available.max())))
+            work = work.astype(dtype)
+        return cls(available, pids, work, safe, len(allocation))
+
+    @classmethod
+    def open(cls, path):
+        with open(path, "rb") as f:
+            magic, version, safe, dtype, n, m, steps = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a Banker's Algorithm trace.")
+        if version != VERSION:
+            raise ValueError(f"{path} has trace version {version}, expected {VERSION}.")
+
+        dtype = np.dtype(dtype.rstrip(b"\0").decode("ascii"))
+        offsets = block_offsets(m, steps, dtype)
+        available = np.fromfile(path, dtype="<i8", count=m, offset=offsets[0])
+        if steps == 0:
+            return cls(available, np.zeros(0, dtype="<u4"), np.zeros((0, m), dtype=dtype), bool(safe), n)
+        pids = np.memmap(path, dtype="<u4", mode="r", offset=offsets[1], shape=(steps,))
+        work = np.memmap(path, dtype=dtype, mode="r", offset=offsets[2], shape=(steps, m))
+        return cls(available, pids, work, bool(safe), n)
+
+    def save(self, path):
+        dtype = np.dtype(self.work.dtype).newbyteorder("<")
+        m, steps = self.num_resources, len(self)
+        offsets = block_offsets(m, steps, dtype)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, int(self.safe), dtype.str.encode("ascii"),
+                                self.num_processes, m, steps).ljust(HEADER_SIZE, b"\0"))
+            position = HEADER_SIZE
+            blocks = (np.asarray(self.available, dtype="<i8"), np.asarray(self.pids, dtype="<u4"),
+                      np.asarray(self.work, dtype=dtype))
+            for offset, block in zip(offsets, blocks):
+                f.write(b"\0" * (offset - position))
+                f.write(np.ascontiguousarray(block).reshape(-1).view(np.uint8))
+                position = offset + block.nbytes
+
+
+def record(allocation, maximum, available, order="lowest", cache=None, need=None):
+    """Runs the safety check once and returns its Trace (empty if the state is unsafe)."""
+    safe, sequence = bankers_algorithm(allocation, maximum, available, order, cache=cache, need=need)
+    return Trace.from_sequence(allocation, available, sequence if safe else [], safe)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record and inspect Banker's Algorithm execution traces.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    p = commands.add_parser("record", help="run a stored dataset and write its trace")
+    p.add_argument("store")
+    p.add_argument("name")
+    p.add_argument("trace")
+    p.add_argument("--order", choices=("lowest", "sweep", "any"), default="lowest")
+    p = commands.add_parser("show", help="print a trace, or one step of it")
+    p.add_argument("trace")
+    p.add_argument("--step", type=int)
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        data = open_store(args.store, None).load(args.name)
+        if data is None:
+            raise SystemExit(f"Dataset '{args.name}' not found in {args.store}.")
+        trace = record(data["allocation"], data["maximum"], data["available"], args.order)
+        trace.save(args.trace)
+        print(f"Recorded {len(trace)} steps ({'safe' if trace.safe else 'unsafe'}) to {args.trace}.")
+        return 0
+
+    trace = Trace.open(args.trace)
+    if not trace.safe:
+        print("UNSAFE")
+        return 1
+    steps = range(len(trace)) if args.step is None else [args.step]
+    for k in steps:
+        pid, work = trace.step(k)
+        print(f"step {k}: P{pid} finished, Available {work.tolist()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Runs the safety check (and the pacing of its animation) off the Tk thread.
+# The worker never touches a widget: it puts (kind, ...) events on a queue and
+# the Tk main loop picks them up with after() polling, a bounded number per
+# tick, so the window stays responsive whatever the problem size.
+#
+#   runner = StepRunner(root, self.handle_event)
+#   runner.start(lambda emit, cancelled: ...)   # False while a run is active
+#   runner.cancel()
+
+import queue
+import threading
+
+POLL_MS = 50
+MAX_EVENTS_PER_POLL = 100
+
+
+class StepRunner:
+    """
+    Runs work(emit, cancelled) on a worker thread, one run at a time. emit(kind,
+    *args) queues an event for handle(event) on the Tk thread; cancelled is a
+    threading.Event the work should check (cancelled.wait(seconds) doubles as a
+    cancellable sleep). A check already inside the engine is not interrupted:
+    cancelling then only drops its result. Exceptions in work arrive as an
+    ("error", message) event; every run ends with ("done",) or ("cancelled",).
+    """
+
+    def __init__(self, widget, handle, poll_ms=POLL_MS, max_events=MAX_EVENTS_PER_POLL):
+        self.widget = widget
+        self.handle = handle
+        self.poll_ms = poll_ms
+        self.max_events = max_events
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+        self.thread = None
+        self.polling = False
+
+    @property
+    def running(self):
+        return self.thread is not None
+
+    def start(self, work):
+        if self.running:
+            return False
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(work, self.cancelled), daemon=True)
+        self.thread.start()
+        if not self.polling:
+            self.polling = True
+            self.widget.after(self.poll_ms, self.poll)
+        return True
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def run(self, work, cancelled):
+        def emit(kind, *args):
+            self.events.put((kind,) + args)
+
+        try:
+            work(emit, cancelled)
+        except Exception as e:
+            emit("error", str(e))
+        emit("cancelled" if cancelled.is_set() else "done")
+
+    def poll(self):
+        for _ in range(self.max_events):
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] in ("done", "cancelled"):
+                self.thread = None
+            self.handle(event)
+
+        if self.running or not self.events.empty():
+            self.widget.after(self.poll_ms, self.poll)
+        else:
+            self.polling = False
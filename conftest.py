@@ -0,0 +1,8 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+# Makes pytest put the repository root on sys.path, so the tests import the
+# banker_* modules as the front-ends do:
+#   python -m pytest -q
@@ -3,6 +3,10 @@
 # Unauthorized use without preserving this notice is a license violation.
 
 
+from banker_engine import bankers_algorithm
+from banker_cache import default_cache
+
+
 def get_matrix_input(rows, cols, name):
     print(f"\nEnter the {name} matrix values row-wise (space-separated):")
     matrix = []
@@ -19,25 +23,8 @@ def get_matrix_input(rows, cols, name):
     return matrix
 
 def is_safe_state(processes, avail, max_demand, allocation):
-    n = len(processes)
-    m = len(avail)
-    need = [[max_demand[i][j] - allocation[i][j] for j in range(m)] for i in range(n)]
-    finish = [False] * n
-    safe_seq = []
-    work = avail[:]
-
-    while len(safe_seq) < n:
-        allocated = False
-        for i in range(n):
-            if not finish[i] and all(need[i][j] <= work[j] for j in range(m)):
-                for j in range(m):
-                    work[j] += allocation[i][j]
-                safe_seq.append(processes[i])
-                finish[i] = True
-                allocated = True
-        if not allocated:
-            return False, []
-    return True, safe_seq
+    safe, sequence = bankers_algorithm(allocation, max_demand, avail, order="sweep", cache=default_cache())
+    return safe, [processes[i] for i in sequence]
 
 def main():
     print("=== Banker's Algorithm Simulator ===")
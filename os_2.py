@@ -4,8 +4,11 @@
 
 
 import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-import numpy as np
+import banker_engine
+from banker_cache import default_cache
+from banker_playback import FigurePlayback
+from banker_plot import TraceView
+from banker_trace import Trace
 import warnings
 
 # Suppress specific warning related to missing glyph in the font
@@ -36,32 +39,10 @@ available = list(map(int, input("\nEnter Available resources (space separated):
 if len(available) != m:
     raise ValueError("Incorrect number of resource types.")
 
-processes = [f'P{i}' for i in range(n)]
-
 # ---------------------- ALGORITHM SECTION ---------------------- #
 
-def calculate_need(max_demand, allocation):
-    return [[max_demand[i][j] - allocation[i][j] for j in range(m)] for i in range(n)]
-
 def bankers_algorithm(allocation, max_demand, available):
-    need = calculate_need(max_demand, allocation)
-    work = available[:]
-    finish = [False] * n
-    safe_sequence = []
-
-    while len(safe_sequence) < n:
-        allocated = False
-        for i in range(n):
-            if not finish[i] and all(need[i][j] <= work[j] for j in range(m)):
-                safe_sequence.append(i)
-                for j in range(m):
-                    work[j] += allocation[i][j]
-                finish[i] = True
-                allocated = True
-                break
-        if not allocated:
-            return False, []
-    return True, safe_sequence
+    return banker_engine.bankers_algorithm(allocation, max_demand, available, cache=default_cache())
 
 safe, sequence = bankers_algorithm(allocation, max_demand, available)
 if not safe:
@@ -73,47 +54,15 @@ else:
 
 # ---------------------- VISUALIZATION SECTION ---------------------- #
 
-# Create a larger figure and adjust the size of the bars
-fig, ax = plt.subplots(figsize=(12, 6))  # Larger figure for visibility
-plt.title("Banker's Algorithm Safe Sequence Simulation", fontsize=14)
-
-# Initialize bars for processes (thicker bars and more visible)
-bars = ax.bar(processes, [0.1] * n, color='blue', width=0.6)  # Initial height set to a small value (0.1)
-
-# Set up the text elements for available resources and status
-status_text = ax.text(0.5, 1.15, '', ha='center', transform=ax.transAxes, fontsize=14)  # Move up
-available_text = ax.text(0.5, -0.2, '', ha='center', transform=ax.transAxes, fontsize=12)  # Move down
-
-current_available = available[:]
-
-# Set proper y-axis limits for visibility
-ax.set_ylim(0, 1)  # Set y-axis to ensure bars can be seen
-
-# Update function for animation
-def update(frame):
-    for bar in bars:
-        bar.set_color('blue')  # Reset all bars to blue
-
-    if frame < len(sequence):
-        pid = sequence[frame]
-        bars[pid].set_color('green')  # Highlight the bar for the current process in green
-
-        status_text.set_text(f'Executing Process P{pid}')
-        
-        # Update available resources after process execution
-        global current_available
-        for j in range(m):
-            current_available[j] += allocation[pid][j]
-
-        available_text.set_text(f'Available: {current_available}')
-    else:
-        status_text.set_text('Safe Sequence Completed ✅')
-        available_text.set_text(f'Final Available: {current_available}')
+# Available after every step, computed once with a cumulative sum; frames only look it up.
+trace = Trace.from_sequence(allocation, available, sequence)
 
-# Create animation with proper frame updates
-ani = animation.FuncAnimation(fig, update, frames=len(sequence) + 1, interval=1500, repeat=False)
+# The bars are drawn once; a frame only blits the highlighted process and the texts.
+view = TraceView(trace)
 
-# Adjust layout to avoid overlap
-plt.tight_layout(pad=5.0)  # Adjust padding for better spacing
+# Play one step per 1.5 s (space pauses, arrows step, home/end seek, +/- change speed);
+# steps the screen cannot keep up with are coalesced into one frame
+playback = FigurePlayback(view.figure, view.show, len(sequence), rate=1 / 1.5, redraw=False)
+playback.play()
 
 plt.show()
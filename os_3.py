@@ -5,8 +5,10 @@
 
 import tkinter as tk
 from tkinter import messagebox
-import time
-import threading
+from banker_cache import default_cache
+from banker_playback import TkPlayback, playback_controls
+from banker_trace import record
+from banker_worker import StepRunner
 
 class BankersGUI:
     def __init__(self, root):
@@ -16,6 +18,9 @@ class BankersGUI:
         self.entries = []
         self.process_labels = []
         self.step_text = tk.StringVar()
+        self.trace = None
+        self.runner = StepRunner(self.root, self.handle_event)
+        self.playback = TkPlayback(self.root, self.show_step)
 
         self.setup_inputs()
 
@@ -38,6 +43,9 @@ class BankersGUI:
             messagebox.showerror("Error", "Please enter valid integers.")
             return
 
+        self.runner.cancel()
+        self.playback.load(0)
+        self.process_labels.clear()
         self.clear_widgets(from_row=3)
 
         self.allocation_entries = []
@@ -68,69 +76,96 @@ class BankersGUI:
             avail_entry.grid(row=5 + self.n, column=1 + j)
             self.available_entries.append(avail_entry)
 
-        tk.Button(self.root, text="Run Banker's Algorithm", command=self.run_simulation_thread).grid(row=6 + self.n, column=0, columnspan=2)
+        self.run_button = tk.Button(self.root, text="Run Banker's Algorithm", command=self.run_simulation_thread)
+        self.run_button.grid(row=6 + self.n, column=0, columnspan=2)
 
         self.step_label = tk.Label(self.root, textvariable=self.step_text, font=("Arial", 12), fg="blue")
         self.step_label.grid(row=7 + self.n, column=0, columnspan=5)
 
+        playback_controls(self.root, self.playback).grid(row=8 + self.n, column=0, columnspan=5)
+
     def clear_widgets(self, from_row):
         for widget in self.root.grid_slaves():
             if int(widget.grid_info()["row"]) >= from_row:
                 widget.destroy()
 
     def run_simulation_thread(self):
-        thread = threading.Thread(target=self.run_simulation)
-        thread.start()
-
-    def run_simulation(self):
-        allocation = [[int(entry.get()) for entry in row] for row in self.allocation_entries]
-        max_demand = [[int(entry.get()) for entry in row] for row in self.max_entries]
-        available = [int(entry.get()) for entry in self.available_entries]
-
-        need = [[max_demand[i][j] - allocation[i][j] for j in range(self.m)] for i in range(self.n)]
-        finish = [False] * self.n
-        safe_sequence = []
+        # Inputs are read here on the Tk thread; the worker only gets plain lists.
+        if self.runner.running:
+            return
+        try:
+            allocation = [[int(entry.get()) for entry in row] for row in self.allocation_entries]
+            max_demand = [[int(entry.get()) for entry in row] for row in self.max_entries]
+            available = [int(entry.get()) for entry in self.available_entries]
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid integers in all fields.")
+            return
 
+        self.playback.load(0)
         for lbl in self.process_labels:
             lbl.destroy()
         self.process_labels.clear()
-
-        row_offset = 8 + self.n
+        self.step_text.set("")
+        if self.runner.start(lambda emit, cancelled: self.run_simulation(allocation, max_demand, available, emit)):
+            self.run_button.config(state="disabled")
+
+    def run_simulation(self, allocation, max_demand, available, emit):
+        # Worker thread: no widget calls, only events. The replay is paced by self.playback.
+        trace = record(allocation, max_demand, available, cache=default_cache())
+        emit("trace", trace)
+
+    def handle_event(self, event):
+        kind = event[0]
+        if kind == "trace":
+            self.replay(event[1])
+        elif kind == "error":
+            messagebox.showerror("Error", event[1])
+        elif kind in ("done", "cancelled"):
+            self.run_button.config(state="normal")
+
+    def replay(self, trace):
+        if not trace.safe:
+            self.step_text.set("❌ No safe sequence found. System is in deadlock.")
+            return
+        self.trace = trace
+        row_offset = 9 + self.n
         for i in range(self.n):
             lbl = tk.Label(self.root, text=f"P{i}: Waiting", font=("Arial", 10), bg="lightgray", width=20)
             lbl.grid(row=row_offset + i, column=0, columnspan=3, pady=2)
             self.process_labels.append(lbl)
-
-        while len(safe_sequence) < self.n:
-            executed = False
-            for i in range(self.n):
-                if not finish[i] and all(need[i][j] <= available[j] for j in range(self.m)):
-                    self.step_text.set(f"🔄 Executing Process P{i}")
-                    self.update_process_label(i, "Executing", "yellow")
-                    self.root.update()
-                    time.sleep(1)
-
-                    for j in range(self.m):
-                        available[j] += allocation[i][j]
-
-                    finish[i] = True
-                    safe_sequence.append(i)
-                    self.update_process_label(i, "Finished", "lightgreen")
-                    self.step_text.set(f"✅ Process P{i} completed. Available: {available}")
-                    self.root.update()
-                    time.sleep(1)
-                    executed = True
-                    break
-
-            if not executed:
-                self.step_text.set("❌ No safe sequence found. System is in deadlock.")
-                self.root.update()
-                return
-
-        self.step_text.set(f"✅ Safe sequence found: {' -> '.join(['P'+str(p) for p in safe_sequence])}")
+        # Two playback steps per process: it starts executing, then it has finished.
+        self.playback.load(2 * len(trace))
+        self.playback.play()
+
+    def show_step(self, position, previous):
+        trace = self.trace
+        if trace is None:
+            return  # the playback buttons were pressed before any run
+        low, high = sorted((position, previous or 0))
+        # Only processes whose executing/finished step lies between the two positions change.
+        for k in range(low // 2, min((high + 1) // 2, len(trace))):
+            pid = int(trace.pids[k])
+            if 2 * k + 2 <= position:
+                self.update_process_label(pid, "Finished", "lightgreen")
+            elif 2 * k + 1 == position:
+                self.update_process_label(pid, "Executing", "yellow")
+            else:
+                self.update_process_label(pid, "Waiting", "lightgray")
+
+        if position == 2 * len(trace):
+            self.step_text.set(f"✅ Safe sequence found: {' -> '.join(['P'+str(p) for p in trace.sequence])}")
+        elif position % 2:
+            self.step_text.set(f"🔄 Executing Process P{int(trace.pids[position // 2])}")
+        elif position:
+            pid, work = trace.step(position // 2 - 1)
+            self.step_text.set(f"✅ Process P{pid} completed. Available: {work.tolist()}")
+        else:
+            self.step_text.set("")
 
     def update_process_label(self, index, state, color):
-        self.process_labels[index].config(text=f"P{index}: {state}", bg=color)
+        # Labels are gone if the matrices were rebuilt while a run was playing.
+        if index < len(self.process_labels):
+            self.process_labels[index].config(text=f"P{index}: {state}", bg=color)
 
 
 if __name__ == "__main__":
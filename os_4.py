@@ -5,6 +5,10 @@
 
 import tkinter as tk
 from tkinter import messagebox
+from banker_engine import calculate_need
+from banker_cache import default_cache
+from banker_grid import GridModel, bind_entry
+from banker_trace import record
 
 class BankersGUI:
     def __init__(self, root):
@@ -32,6 +36,11 @@ class BankersGUI:
         self.step_label = tk.Label(root, text="Step-by-Step Progress:")
         self.step_label.grid(row=3, column=0, columnspan=2, pady=10)
 
+        # Step view widgets, built once per matrix size by build_step_view
+        self.step_frames = []
+        self.cell_labels = []
+        self.finished_rows = set()
+
     def generate_matrices(self):
         # Get the number of processes and resources
         try:
@@ -46,6 +55,10 @@ class BankersGUI:
         for widget in self.root.winfo_children():
             widget.grid_forget()
 
+        # Every Entry is parsed into these models as it is typed, so a run reads no widgets
+        self.matrix_model = GridModel(("Allocation", "Maximum"), self.processes, self.resources)
+        self.available_model = GridModel(("Available",), 1, self.resources)
+
         # Create Allocation Frame
         alloc_frame = tk.LabelFrame(self.root, text="Allocation Matrix", padx=10, pady=10)
         alloc_frame.grid(row=4, column=0, padx=10, pady=10)
@@ -61,6 +74,7 @@ class BankersGUI:
             for j in range(self.resources):
                 entry = tk.Entry(alloc_frame, width=5)
                 entry.grid(row=i + 1, column=j + 1, padx=5, pady=5)
+                bind_entry(entry, self.matrix_model, 0, i, j)
                 row_entries.append(entry)
             self.allocation_entries.append(row_entries)
 
@@ -79,6 +93,7 @@ class BankersGUI:
             for j in range(self.resources):
                 entry = tk.Entry(max_frame, width=5)
                 entry.grid(row=i + 1, column=j + 1, padx=5, pady=5)
+                bind_entry(entry, self.matrix_model, 1, i, j)
                 row_entries.append(entry)
             self.max_entries.append(row_entries)
 
@@ -91,6 +106,7 @@ class BankersGUI:
             tk.Label(avail_frame, text=chr(65 + j)).grid(row=0, column=j)
             entry = tk.Entry(avail_frame, width=5)
             entry.grid(row=1, column=j, padx=5, pady=5)
+            bind_entry(entry, self.available_model, 0, 0, j)
             self.available_entries.append(entry)
 
         # Run Button
@@ -98,101 +114,120 @@ class BankersGUI:
         run_button.grid(row=6, column=0, columnspan=2, pady=10)
 
     def run_simulation(self):
-        # Read the matrices from the input fields
-        allocation = [[int(self.allocation_entries[i][j].get()) for j in range(self.resources)] for i in range(self.processes)]
-        maximum = [[int(self.max_entries[i][j].get()) for j in range(self.resources)] for i in range(self.processes)]
-        available = [int(self.available_entries[j].get()) for j in range(self.resources)]
+        # Read the matrices from the models the input fields fill in
+        try:
+            allocation = self.matrix_model.matrix(0)
+            maximum = self.matrix_model.matrix(1)
+            available = self.available_model.matrix(0)[0]
+        except ValueError:
+            messagebox.showerror("Input Error", "Please enter valid integers in all fields.")
+            return
 
         # Calculate the Need Matrix
-        need = [[maximum[i][j] - allocation[i][j] for j in range(self.resources)] for i in range(self.processes)]
-
-        # Initialize work and finish arrays
-        work = available[:]
-        finish = [False] * self.processes
-        safe_sequence = []
+        need = calculate_need(maximum, allocation)
 
         # Step-by-step progress display
         self.step_label.config(text="Step-by-Step Progress:")
-        self.update_matrices(allocation, maximum, need, work, safe_sequence, step="Initial State")
+        self.build_step_view(allocation, maximum, need)
+        self.update_matrices(available.tolist(), [], step="Initial State")
 
         # Banker's Algorithm to check for safe state
-        while len(safe_sequence) < self.processes:
-            made_progress = False
-            for i in range(self.processes):
-                if not finish[i] and all(need[i][j] <= work[j] for j in range(self.resources)):
-                    # Process i can finish
-                    safe_sequence.append(i)
-                    finish[i] = True
-                    # Update work by adding the allocation of the completed process
-                    work = [work[j] + allocation[i][j] for j in range(self.resources)]
-                    made_progress = True
-                    self.update_matrices(allocation, maximum, need, work, safe_sequence, step=f"Process P{i} finishes")
-                    break
-            
-            if not made_progress:
-                # If no progress is made, the system is in an unsafe state
-                messagebox.showinfo("Result", "The system is in an unsafe state!")
-                return
-        
+        trace = record(allocation, maximum, available, cache=default_cache(), need=need)
+        if not trace.safe:
+            # If no progress is made, the system is in an unsafe state
+            messagebox.showinfo("Result", "The system is in an unsafe state!")
+            return
+
+        safe_sequence = []
+        for k in range(len(trace)):
+            # Process i can finish and releases its allocation into work
+            i, work = trace.step(k)
+            safe_sequence.append(i)
+            self.update_matrices(work.tolist(), safe_sequence, step=f"Process P{i} finishes", finished=i)
+
         # If we get here, the system is in a safe state
         messagebox.showinfo("Result", f"The system is in a safe state! Safe sequence: {safe_sequence}")
 
-    def update_matrices(self, allocation, maximum, need, work, safe_sequence, step):
+    def build_step_view(self, allocation, maximum, need):
         """
-        Function to update the matrices and display them along with the step in Banker's Algorithm
+        Creates the Allocation, Max and Need grids and the Work / Safe Sequence
+        rows once; later steps only change the labels that differ. Running again
+        with the same size reuses the grids and only rewrites changed cells.
         """
-        # Clear the previous matrices and update the label
-        self.step_label.config(text=f"Step-by-Step Progress: {step}")
-
-        # Recreate the Allocation Matrix
-        alloc_frame = tk.LabelFrame(self.root, text="Allocation Matrix", padx=10, pady=10)
-        alloc_frame.grid(row=7, column=0, padx=10, pady=10)
-
-        for j in range(self.resources):
-            tk.Label(alloc_frame, text=chr(65 + j)).grid(row=0, column=j + 1)
-
-        for i in range(self.processes):
-            tk.Label(alloc_frame, text=f"P{i}").grid(row=i + 1, column=0)
-            for j in range(self.resources):
-                tk.Label(alloc_frame, text=str(allocation[i][j])).grid(row=i + 1, column=j + 1)
+        reuse = (self.step_frames and all(frame.winfo_manager() == "grid" for frame in self.step_frames)
+                 and len(self.cell_labels[0]) == self.processes
+                 and all(len(row_labels) == self.resources for row_labels in self.cell_labels[0]))
+        if reuse:
+            for labels, matrix in zip(self.cell_labels, (allocation, maximum, need)):
+                for i, row_labels in enumerate(labels):
+                    for j, label in enumerate(row_labels):
+                        if label.cget("text") != str(matrix[i][j]):
+                            label.config(text=str(matrix[i][j]))
+            for i in self.finished_rows:
+                for labels in self.cell_labels:
+                    for label in labels[i]:
+                        label.config(fg=self.work_label.cget("fg"))
+            self.finished_rows = set()
+            return
 
-        # Recreate the Max Matrix
-        max_frame = tk.LabelFrame(self.root, text="Maximum Matrix", padx=10, pady=10)
-        max_frame.grid(row=7, column=1, padx=10, pady=10)
+        for frame in self.step_frames:
+            frame.destroy()
+        self.finished_rows = set()
 
-        for j in range(self.resources):
-            tk.Label(max_frame, text=chr(65 + j)).grid(row=0, column=j + 1)
+        # One label per cell: cell_labels[k][i][j] for Allocation, Max and Need
+        self.cell_labels = []
+        places = (("Allocation Matrix", allocation, 7, 0), ("Maximum Matrix", maximum, 7, 1), ("Need Matrix", need, 8, 0))
+        self.step_frames = []
+        for title, matrix, row, column in places:
+            frame = tk.LabelFrame(self.root, text=title, padx=10, pady=10)
+            frame.grid(row=row, column=column, padx=10, pady=10)
+            self.step_frames.append(frame)
 
-        for i in range(self.processes):
-            tk.Label(max_frame, text=f"P{i}").grid(row=i + 1, column=0)
             for j in range(self.resources):
-                tk.Label(max_frame, text=str(maximum[i][j])).grid(row=i + 1, column=j + 1)
-
-        # Recreate the Need Matrix
-        need_frame = tk.LabelFrame(self.root, text="Need Matrix", padx=10, pady=10)
-        need_frame.grid(row=8, column=0, padx=10, pady=10)
-
-        for j in range(self.resources):
-            tk.Label(need_frame, text=chr(65 + j)).grid(row=0, column=j + 1)
+                tk.Label(frame, text=chr(65 + j)).grid(row=0, column=j + 1)
 
-        for i in range(self.processes):
-            tk.Label(need_frame, text=f"P{i}").grid(row=i + 1, column=0)
-            for j in range(self.resources):
-                tk.Label(need_frame, text=str(need[i][j])).grid(row=i + 1, column=j + 1)
+            labels = []
+            for i in range(self.processes):
+                tk.Label(frame, text=f"P{i}").grid(row=i + 1, column=0)
+                row_labels = []
+                for j in range(self.resources):
+                    label = tk.Label(frame, text=str(matrix[i][j]))
+                    label.grid(row=i + 1, column=j + 1)
+                    row_labels.append(label)
+                labels.append(row_labels)
+            self.cell_labels.append(labels)
 
         # Work Vector display
         work_frame = tk.LabelFrame(self.root, text="Work Vector", padx=10, pady=10)
         work_frame.grid(row=9, column=0, columnspan=2, pady=10)
-        
         tk.Label(work_frame, text="Work = ").grid(row=0, column=0)
-        tk.Label(work_frame, text=str(work)).grid(row=0, column=1)
+        self.work_label = tk.Label(work_frame)
+        self.work_label.grid(row=0, column=1)
 
         # Safe Sequence Display
         safe_frame = tk.LabelFrame(self.root, text="Safe Sequence", padx=10, pady=10)
         safe_frame.grid(row=10, column=0, columnspan=2, pady=10)
-        
         tk.Label(safe_frame, text="Safe Sequence = ").grid(row=0, column=0)
-        tk.Label(safe_frame, text=str(safe_sequence)).grid(row=0, column=1)
+        self.safe_label = tk.Label(safe_frame)
+        self.safe_label.grid(row=0, column=1)
+
+        self.step_frames += [work_frame, safe_frame]
+
+    def update_matrices(self, work, safe_sequence, step, finished=None):
+        """
+        Shows one step: the step text, the work vector, the safe sequence and, if
+        a process just finished, its row in each matrix. The cells themselves
+        never change while the algorithm runs, so they are left alone.
+        """
+        self.step_label.config(text=f"Step-by-Step Progress: {step}")
+        self.work_label.config(text=str(work))
+        self.safe_label.config(text=str(safe_sequence))
+
+        if finished is not None and finished not in self.finished_rows:
+            self.finished_rows.add(finished)
+            for labels in self.cell_labels:
+                for label in labels[finished]:
+                    label.config(fg="green")
 
 root = tk.Tk()
 app = BankersGUI(root)
@@ -5,7 +5,11 @@
 
 import tkinter as tk
 from tkinter import messagebox
-import threading
+from banker_engine import bankers_algorithm
+from banker_cache import default_cache
+from banker_grid import GridModel, bind_entry
+from banker_playback import TkPlayback, playback_controls
+from banker_worker import StepRunner
 
 class BankersAlgorithmGUI:
     def __init__(self, master):
@@ -14,6 +18,14 @@ class BankersAlgorithmGUI:
 
         self.num_processes = 5
         self.num_resources = 3
+        # Every Entry is parsed into these models as it is typed, so a run reads no widgets.
+        self.matrix_model = GridModel(("Allocation", "Maximum"), self.num_processes, self.num_resources)
+        self.available_model = GridModel(("Available",), 1, self.num_resources)
+        self.last_run = None
+        self.runner = StepRunner(self.master, self.handle_event)
+        self.playback = TkPlayback(self.master, self.show_step)
+        self.sequence = []
+        self.finished_labels = []
 
         self.create_widgets()
 
@@ -35,10 +47,12 @@ class BankersAlgorithmGUI:
             for j in range(self.num_resources):
                 entry_alloc = tk.Entry(allocation_frame, width=5, justify='center')
                 entry_alloc.grid(row=i, column=j, padx=2, pady=2)
+                bind_entry(entry_alloc, self.matrix_model, 0, i, j)
                 row_entries_alloc.append(entry_alloc)
 
                 entry_max = tk.Entry(max_frame, width=5, justify='center')
                 entry_max.grid(row=i, column=j, padx=2, pady=2)
+                bind_entry(entry_max, self.matrix_model, 1, i, j)
                 row_entries_max.append(entry_max)
             self.allocation_entries.append(row_entries_alloc)
             self.max_entries.append(row_entries_max)
@@ -50,63 +64,89 @@ class BankersAlgorithmGUI:
         for i in range(self.num_resources):
             entry = tk.Entry(available_frame, width=5, justify='center')
             entry.grid(row=0, column=i, padx=2, pady=2)
+            bind_entry(entry, self.available_model, 0, 0, i)
             self.available_entries.append(entry)
 
         self.run_button = tk.Button(self.master, text="Run Banker's Algorithm", command=self.run_thread)
-        self.run_button.grid(row=4, column=0, columnspan=2, pady=10)
+        self.run_button.grid(row=4, column=0, pady=10)
+        self.cancel_button = tk.Button(self.master, text="Cancel", command=self.runner.cancel, state="disabled")
+        self.cancel_button.grid(row=4, column=1, pady=10)
 
         self.safe_sequence_label = tk.Label(self.master, text="", font=("Arial", 12), fg="blue")
         self.safe_sequence_label.grid(row=5, column=0, columnspan=2)
 
+        playback_controls(self.master, self.playback).grid(row=6, column=0, columnspan=2)
+
         self.finished_frame = tk.Frame(self.master)
-        self.finished_frame.grid(row=6, column=0, columnspan=2, pady=5)
+        self.finished_frame.grid(row=7, column=0, columnspan=2, pady=5)
 
     def run_thread(self):
-        for widget in self.finished_frame.winfo_children():
-            widget.destroy()
-        self.safe_sequence_label.config(text="")
-        threading.Thread(target=self.run_simulation).start()
-
-    def run_simulation(self):
+        # Inputs come from the models on the Tk thread; the worker only gets the arrays.
+        if self.runner.running:
+            return
         try:
-            allocation = [[int(entry.get()) for entry in row] for row in self.allocation_entries]
-            maximum = [[int(entry.get()) for entry in row] for row in self.max_entries]
-            available = [int(entry.get()) for entry in self.available_entries]
+            allocation = self.matrix_model.matrix(0)
+            maximum = self.matrix_model.matrix(1)
+            available = self.available_model.matrix(0)[0]
         except ValueError:
             messagebox.showerror("Input Error", "Please enter valid integers in all fields.")
             return
 
-        need = [[maximum[i][j] - allocation[i][j] for j in range(self.num_resources)] for i in range(self.num_processes)]
-
-        finish = [False] * self.num_processes
-        safe_sequence = []
-
-        while len(safe_sequence) < self.num_processes:
-            allocated_in_this_round = False
-            for i in range(self.num_processes):
-                if not finish[i] and all(need[i][j] <= available[j] for j in range(self.num_resources)):
-                    for j in range(self.num_resources):
-                        available[j] += allocation[i][j]
-                    finish[i] = True
-                    safe_sequence.append(i)
-                    allocated_in_this_round = True
-                    break
-            if not allocated_in_this_round:
-                messagebox.showerror("Deadlock Detected", "The system is not in a safe state!")
-                return
-
-        self.master.after(0, lambda: self.display_sequence(safe_sequence))
+        self.clear_steps()
+        self.safe_sequence_label.config(text="")
+        state = (self.matrix_model.version, self.available_model.version)
+        if self.last_run is not None and self.last_run[0] == state:
+            # Nothing was edited since the last run: show its result without checking again.
+            self.handle_event(self.last_run[1])
+            return
+        if self.runner.start(lambda emit, cancelled: self.run_simulation(state, allocation, maximum, available, emit, cancelled)):
+            self.run_button.config(state="disabled")
+            self.cancel_button.config(state="normal")
+
+    def run_simulation(self, state, allocation, maximum, available, emit, cancelled):
+        # Worker thread: computes the sequence, no widget calls. The animation is paced by self.playback.
+        safe, safe_sequence = bankers_algorithm(allocation, maximum, available, cache=default_cache())
+        if cancelled.is_set():  # Cancel cannot stop the check itself, only discard its result
+            return
+        if not safe:
+            emit("unsafe", state)
+            return
+        emit("sequence", safe_sequence, state)
+
+    def handle_event(self, event):
+        kind = event[0]
+        if kind in ("sequence", "unsafe"):
+            self.last_run = (event[-1], event)
+        if kind == "sequence":
+            self.display_sequence(event[1])
+        elif kind == "unsafe":
+            messagebox.showerror("Deadlock Detected", "The system is not in a safe state!")
+        elif kind == "error":
+            messagebox.showerror("Error", event[1])
+        elif kind in ("done", "cancelled"):
+            self.run_button.config(state="normal")
+            self.cancel_button.config(state="disabled")
 
     def display_sequence(self, sequence):
         self.safe_sequence_label.config(text="\u2705 Safe sequence found: " + " -> ".join([f"P{p}" for p in sequence]))
-        self.animate_safe_sequence(sequence)
-
-    def animate_safe_sequence(self, sequence, index=0):
-        if index < len(sequence):
-            process = sequence[index]
+        self.sequence = sequence
+        self.playback.load(len(sequence))
+        self.playback.play()
+
+    def show_step(self, position, previous):
+        # One label per finished process; seeking back removes the later ones.
+        while len(self.finished_labels) > position:
+            self.finished_labels.pop().destroy()
+        for process in self.sequence[len(self.finished_labels):position]:
             label = tk.Label(self.finished_frame, text=f"P{process}: Finished", bg="lightgreen", font=("Arial", 10), width=20)
             label.pack(pady=2)
-            self.master.after(1000, lambda: self.animate_safe_sequence(sequence, index + 1))
+            self.finished_labels.append(label)
+
+    def clear_steps(self):
+        self.playback.load(0)
+        for label in self.finished_labels:
+            label.destroy()
+        self.finished_labels = []
 
 if __name__ == "__main__":
     root = tk.Tk()
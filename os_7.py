@@ -3,25 +3,39 @@
 # Unauthorized use without preserving this notice is a license violation.
 
 
-import tkinter as tk
-from tkinter import messagebox, simpledialog
-import threading
-import json
 import os
+import time
+import tkinter as tk
+from tkinter import filedialog, messagebox, simpledialog
+from banker_engine import bankers_algorithm
+from banker_cache import default_cache
+from banker_grid import GridModel, MatrixGrid, bind_entry
+from banker_import import load_state_file, parse_state
+from banker_playback import TkPlayback, playback_controls
+from banker_store import CachedStore, open_store
+from banker_worker import StepRunner
 
-DATA_FILE = "banker_data.json"
+STORE_FILE = "banker_data.db"
 
 class BankersAlgorithmGUI:
     def __init__(self, master):
         self.master = master
         self.master.title("Banker's Algorithm Simulator")
+        self.store = CachedStore(open_store(STORE_FILE))
 
         self.num_processes = 0
         self.num_resources = 0
 
-        self.allocation_entries = []
-        self.max_entries = []
+        self.matrix_model = GridModel(("Allocation Matrix", "Maximum Matrix"), 0, 0)
+        self.matrix_grid = None
         self.available_entries = []
+        # Available is parsed into its own model as it is typed, like the grid cells.
+        self.available_model = GridModel(("Available",), 1, 0)
+        self.last_run = None
+        self.playback = TkPlayback(self.master, self.show_step)
+        self.sequence = []
+        self.runner = StepRunner(self.master, self.handle_event)
+        self.finished_labels = []
 
         self.create_main_layout()
 
@@ -46,7 +60,10 @@ class BankersAlgorithmGUI:
         button_frame = tk.Frame(self.master)
         button_frame.pack(pady=5)
 
-        tk.Button(button_frame, text="Run Banker's Algorithm", command=self.run_thread).pack(side='left', padx=5)
+        self.run_button = tk.Button(button_frame, text="Run Banker's Algorithm", command=self.run_thread)
+        self.run_button.pack(side='left', padx=5)
+        self.cancel_button = tk.Button(button_frame, text="Cancel", command=self.runner.cancel, state="disabled")
+        self.cancel_button.pack(side='left', padx=5)
         tk.Button(button_frame, text="Save Dataset", command=self.save_data).pack(side='left', padx=5)
         tk.Button(button_frame, text="Reset", command=self.reset_fields).pack(side='left', padx=5)
 
@@ -56,51 +73,47 @@ class BankersAlgorithmGUI:
         self.dropdown.pack(side='left', padx=5)
 
         tk.Button(button_frame, text="Load", command=self.load_data).pack(side='left', padx=5)
+        tk.Button(button_frame, text="Import File", command=self.import_file).pack(side='left', padx=5)
+        tk.Button(button_frame, text="Paste", command=self.paste_state).pack(side='left', padx=5)
 
         self.safe_sequence_label = tk.Label(self.master, text="", font=("Arial", 12), fg="blue")
         self.safe_sequence_label.pack(pady=5)
 
+        playback_controls(self.master, self.playback).pack(pady=5)
+
         self.finished_frame = tk.Frame(self.master)
         self.finished_frame.pack()
 
-    def create_matrix_inputs(self):
-        for widget in self.matrix_frame.winfo_children():
-            widget.destroy()
-
-        self.allocation_entries = []
-        self.max_entries = []
-        self.available_entries = []
-
-        tk.Label(self.matrix_frame, text="Allocation Matrix", font=("Arial", 10, "bold")).grid(row=0, column=0)
-        tk.Label(self.matrix_frame, text="Maximum Matrix", font=("Arial", 10, "bold")).grid(row=0, column=1)
-
-        alloc_frame = tk.Frame(self.matrix_frame)
-        alloc_frame.grid(row=1, column=0, padx=10)
-        max_frame = tk.Frame(self.matrix_frame)
-        max_frame.grid(row=1, column=1, padx=10)
-
-        for i in range(self.num_processes):
-            row_alloc = []
-            row_max = []
-            for j in range(self.num_resources):
-                e1 = tk.Entry(alloc_frame, width=5, justify='center')
-                e1.grid(row=i, column=j, padx=2, pady=2)
-                row_alloc.append(e1)
-
-                e2 = tk.Entry(max_frame, width=5, justify='center')
-                e2.grid(row=i, column=j, padx=2, pady=2)
-                row_max.append(e2)
+        self.status_label = tk.Label(self.master, text="", anchor="w", relief="sunken")
+        self.status_label.pack(side="bottom", fill="x")
 
-            self.allocation_entries.append(row_alloc)
-            self.max_entries.append(row_max)
-
-        tk.Label(self.matrix_frame, text="Available Resources", font=("Arial", 10)).grid(row=2, column=0, columnspan=2)
-        avail_frame = tk.Frame(self.matrix_frame)
-        avail_frame.grid(row=3, column=0, columnspan=2)
+    def create_matrix_inputs(self):
+        # Allocation and Max live in one compact model; the grid only draws the visible rows.
+        # Both are built once and resized afterwards, so a new size rebuilds no widgets.
+        if self.matrix_grid is None:
+            self.matrix_grid = MatrixGrid(self.matrix_frame, self.matrix_model)
+            self.matrix_grid.grid(row=0, column=0, columnspan=2, sticky="nsew")
+            tk.Label(self.matrix_frame, text="Available Resources", font=("Arial", 10)).grid(row=2, column=0, columnspan=2)
+            self.avail_frame = tk.Frame(self.matrix_frame)
+            self.avail_frame.grid(row=3, column=0, columnspan=2)
+
+        self.matrix_grid.hide_editor()
+        self.matrix_model.resize(self.num_processes, self.num_resources)
+        self.matrix_model.clear()
+        self.matrix_grid.reshape()
+        self.resize_available()
+        for e in self.available_entries:
+            e.delete(0, tk.END)
 
-        for i in range(self.num_resources):
-            e = tk.Entry(avail_frame, width=5, justify='center')
+    def resize_available(self):
+        # Entries are only created or destroyed when the number of resources changes.
+        self.available_model.resize(1, self.num_resources)
+        while len(self.available_entries) > self.num_resources:
+            self.available_entries.pop().destroy()
+        for i in range(len(self.available_entries), self.num_resources):
+            e = tk.Entry(self.avail_frame, width=5, justify='center')
             e.grid(row=0, column=i, padx=2, pady=2)
+            bind_entry(e, self.available_model, 0, 0, i)
             self.available_entries.append(e)
 
     def update_matrix(self):
@@ -116,60 +129,87 @@ class BankersAlgorithmGUI:
         self.create_matrix_inputs()
 
     def run_thread(self):
-        for widget in self.finished_frame.winfo_children():
-            widget.destroy()
-        self.safe_sequence_label.config(text="")
-        threading.Thread(target=self.run_simulation).start()
-
-    def run_simulation(self):
+        # Inputs come from the models on the Tk thread; the worker only gets the arrays.
+        if self.runner.running:
+            return
         try:
-            alloc = [[int(e.get()) for e in row] for row in self.allocation_entries]
-            maxm = [[int(e.get()) for e in row] for row in self.max_entries]
-            avail = [int(e.get()) for e in self.available_entries]
+            if self.matrix_grid:
+                self.matrix_grid.flush()
+            alloc = self.matrix_model.matrix(0)
+            maxm = self.matrix_model.matrix(1)
+            avail = self.available_model.matrix(0)[0]
         except ValueError:
             messagebox.showerror("Input Error", "Please enter valid integers.")
             return
 
-        need = [[maxm[i][j] - alloc[i][j] for j in range(self.num_resources)] for i in range(self.num_processes)]
-        finish = [False] * self.num_processes
-        sequence = []
-
-        while len(sequence) < self.num_processes:
-            allocated = False
-            for i in range(self.num_processes):
-                if not finish[i] and all(need[i][j] <= avail[j] for j in range(self.num_resources)):
-                    for j in range(self.num_resources):
-                        avail[j] += alloc[i][j]
-                    finish[i] = True
-                    sequence.append(i)
-                    allocated = True
-                    break
-            if not allocated:
-                messagebox.showerror("Deadlock", "The system is not in a safe state.")
-                return
-
-        self.master.after(0, lambda: self.display_sequence(sequence))
+        self.clear_steps()
+        self.safe_sequence_label.config(text="")
+        state = (self.matrix_model.version, self.available_model.version)
+        if self.last_run is not None and self.last_run[0] == state:
+            self.status_label.config(text="Nothing changed since the last run; showing its result again.")
+            self.handle_event(self.last_run[1])
+            return
+        if self.runner.start(lambda emit, cancelled: self.run_simulation(state, alloc, maxm, avail, emit, cancelled)):
+            self.run_button.config(state="disabled")
+            self.cancel_button.config(state="normal")
+
+    def run_simulation(self, state, alloc, maxm, avail, emit, cancelled):
+        # Worker thread: no widget calls, only events. The animation is paced by self.playback.
+        safe, sequence = bankers_algorithm(alloc, maxm, avail, cache=default_cache())
+        if cancelled.is_set():  # Cancel cannot stop the check itself, only discard its result
+            return
+        if not safe:
+            emit("unsafe", state)
+            return
+        emit("sequence", sequence, state)
+
+    def handle_event(self, event):
+        kind = event[0]
+        if kind in ("sequence", "unsafe"):
+            self.last_run = (event[-1], event)
+        if kind == "sequence":
+            self.display_sequence(event[1])
+        elif kind == "unsafe":
+            messagebox.showerror("Deadlock", "The system is not in a safe state.")
+        elif kind == "error":
+            messagebox.showerror("Error", event[1])
+        elif kind in ("done", "cancelled"):
+            self.run_button.config(state="normal")
+            self.cancel_button.config(state="disabled")
+            if kind == "cancelled":
+                self.safe_sequence_label.config(text="Cancelled.")
 
     def display_sequence(self, sequence):
         self.safe_sequence_label.config(text="\u2705 Safe sequence: " + " → ".join([f"P{p}" for p in sequence]))
-        self.animate_safe_sequence(sequence)
-
-    def animate_safe_sequence(self, sequence, index=0):
-        if index < len(sequence):
-            p = sequence[index]
+        self.sequence = sequence
+        self.playback.load(len(sequence))
+        self.playback.play()
+
+    def show_step(self, position, previous):
+        # One label per finished process; seeking back removes the later ones.
+        while len(self.finished_labels) > position:
+            self.finished_labels.pop().destroy()
+        for p in self.sequence[len(self.finished_labels):position]:
             label = tk.Label(self.finished_frame, text=f"P{p} Finished", bg="lightgreen", font=("Arial", 10), width=20)
             label.pack(pady=2)
-            self.master.after(1000, lambda: self.animate_safe_sequence(sequence, index + 1))
+            self.finished_labels.append(label)
+
+    def clear_steps(self):
+        self.playback.load(0)
+        for label in self.finished_labels:
+            label.destroy()
+        self.finished_labels = []
 
     def reset_fields(self):
-        for row in self.allocation_entries + self.max_entries:
-            for e in row:
-                e.delete(0, tk.END)
+        self.runner.cancel()
+        self.matrix_model.clear()
+        if self.matrix_grid:
+            self.matrix_grid.hide_editor()
+            self.matrix_grid.redraw()
         for e in self.available_entries:
             e.delete(0, tk.END)
         self.safe_sequence_label.config(text="")
-        for widget in self.finished_frame.winfo_children():
-            widget.destroy()
+        self.clear_steps()
 
     def save_data(self):
         name = simpledialog.askstring("Save Dataset", "Enter dataset name:")
@@ -177,9 +217,11 @@ class BankersAlgorithmGUI:
             return
 
         try:
-            alloc = [[int(e.get()) for e in row] for row in self.allocation_entries]
-            maxm = [[int(e.get()) for e in row] for row in self.max_entries]
-            avail = [int(e.get()) for e in self.available_entries]
+            if self.matrix_grid:
+                self.matrix_grid.flush()
+            alloc = self.matrix_model.matrix(0)
+            maxm = self.matrix_model.matrix(1)
+            avail = self.available_model.matrix(0)[0]
         except ValueError:
             messagebox.showerror("Input Error", "All fields must contain valid integers.")
             return
@@ -187,31 +229,20 @@ class BankersAlgorithmGUI:
         data = {
             "num_processes": self.num_processes,
             "num_resources": self.num_resources,
-            "allocation": alloc,
-            "maximum": maxm,
-            "available": avail
+            "allocation": alloc.tolist(),
+            "maximum": maxm.tolist(),
+            "available": avail.tolist()
         }
 
-        all_data = {}
-        if os.path.exists(DATA_FILE):
-            with open(DATA_FILE, "r") as f:
-                all_data = json.load(f)
-
-        all_data[name] = data
-        with open(DATA_FILE, "w") as f:
-            json.dump(all_data, f, indent=2)
+        self.store.save(name, data)
 
         self.refresh_dataset_list()
         messagebox.showinfo("Saved", f"Dataset '{name}' saved successfully.")
 
     def refresh_dataset_list(self):
-        if not os.path.exists(DATA_FILE):
-            return
-        with open(DATA_FILE, "r") as f:
-            all_data = json.load(f)
         menu = self.dropdown["menu"]
         menu.delete(0, "end")
-        for key in all_data:
+        for key in self.store.names():
             menu.add_command(label=key, command=lambda value=key: self.dataset_var.set(value))
 
     def load_data(self):
@@ -219,37 +250,67 @@ class BankersAlgorithmGUI:
         if name == "Select Dataset":
             return
 
-        if not os.path.exists(DATA_FILE):
+        start = time.perf_counter()
+        data = self.store.load(name)
+        if not data:
             return
 
-        with open(DATA_FILE, "r") as f:
-            all_data = json.load(f)
+        self.fill_fields(data, f"dataset '{name}'", start)
 
-        data = all_data.get(name)
-        if not data:
+    def import_file(self):
+        path = filedialog.askopenfilename(filetypes=[("Banker state", "*.txt *.csv *.tsv *.json"), ("All files", "*")])
+        if not path:
+            return
+        try:
+            data = load_state_file(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Import Error", str(e))
             return
+        self.fill_fields(data, os.path.basename(path))
 
-        self.num_processes = data["num_processes"]
-        self.num_resources = data["num_resources"]
+    def paste_state(self):
+        # Clipboard text in the banker_import layout: Allocation, Max and Available blocks.
+        try:
+            data = parse_state(self.master.clipboard_get())
+        except (tk.TclError, ValueError) as e:
+            messagebox.showerror("Paste Error", str(e))
+            return
+        self.fill_fields(data, "clipboard")
+
+    def fill_fields(self, data, source, start=None):
+        """
+        Shows a dataset in one batch: the model takes both matrices at once, the
+        grid redraws its visible rows once and the widgets are reused. The time
+        taken goes to the status bar.
+        """
+        start = time.perf_counter() if start is None else start
+        if self.matrix_grid is None:
+            self.create_matrix_inputs()
+        try:
+            # Checked first: Available entries it does not cover would keep the previous dataset's values.
+            allocation = data["allocation"]
+            if len(allocation) and len(data["available"]) != len(allocation[0]):
+                raise ValueError(f"Available has {len(data['available'])} values for {len(allocation[0])} resource types.")
+            self.matrix_grid.load((allocation, data["maximum"]))
+        except (KeyError, TypeError, ValueError) as e:
+            messagebox.showerror("Load Error", str(e))
+            return
+
+        self.num_processes = self.matrix_model.rows
+        self.num_resources = self.matrix_model.cols
         self.proc_entry.delete(0, tk.END)
         self.proc_entry.insert(0, str(self.num_processes))
         self.res_entry.delete(0, tk.END)
         self.res_entry.insert(0, str(self.num_resources))
-        self.create_matrix_inputs()
-
-        for i in range(self.num_processes):
-            for j in range(self.num_resources):
-                self.allocation_entries[i][j].delete(0, tk.END)
-                self.allocation_entries[i][j].insert(0, data["allocation"][i][j])
 
-                self.max_entries[i][j].delete(0, tk.END)
-                self.max_entries[i][j].insert(0, data["maximum"][i][j])
-
-        for j in range(self.num_resources):
-            self.available_entries[j].delete(0, tk.END)
-            self.available_entries[j].insert(0, data["available"][j])
+        self.resize_available()
+        for e, value in zip(self.available_entries, data["available"]):
+            e.delete(0, tk.END)
+            e.insert(0, value)
 
-        messagebox.showinfo("Loaded", f"Dataset '{name}' loaded successfully.")
+        seconds = time.perf_counter() - start
+        self.status_label.config(text=f"Loaded {source}: {self.num_processes} processes x {self.num_resources} resources "
+                                      f"in {seconds * 1000:.0f} ms")
 
 if __name__ == "__main__":
     root = tk.Tk()
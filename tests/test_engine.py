@@ -0,0 +1,72 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+import pytest
+
+from banker_bench import CASES, make_state
+from banker_engine import BACKENDS, bankers_algorithm
+
+SIZES = [(1, 1), (5, 3), (16, 4), (17, 3), (120, 6), (400, 2)]
+
+
+def is_safe_sequence(allocation, maximum, available, sequence):
+    work = list(available)
+    if sorted(sequence) != list(range(len(allocation))):
+        return False
+    for pid in sequence:
+        if any(maximum[pid][j] - allocation[pid][j] > work[j] for j in range(len(work))):
+            return False
+        work = [w + a for w, a in zip(work, allocation[pid])]
+    return True
+
+
+@pytest.mark.parametrize("order", ["lowest", "sweep"])
+@pytest.mark.parametrize("case", CASES)
+@pytest.mark.parametrize("n,m", SIZES)
+def test_backends_agree(order, case, n, m):
+    allocation, maximum, available = (x.tolist() for x in make_state(case, n, m))
+    results = {name: engine(allocation, maximum, available, order) for name, engine in BACKENDS.items()}
+    assert results["numpy"] == results["python"]
+    assert results["worklist"] == results["python"]
+    safe, sequence = results["python"]
+    if safe:
+        assert is_safe_sequence(allocation, maximum, available, sequence)
+
+
+@pytest.mark.parametrize("n,m", SIZES)
+def test_any_order_is_a_safe_sequence(n, m):
+    allocation, maximum, available = (x.tolist() for x in make_state("safe", n, m))
+    for engine in BACKENDS.values():
+        safe, sequence = engine(allocation, maximum, available, "any")
+        assert safe and is_safe_sequence(allocation, maximum, available, sequence)
+
+
+@pytest.mark.parametrize("order", ["lowest", "sweep"])
+@pytest.mark.parametrize("n,m", SIZES)
+def test_precomputed_need_gives_the_same_result(order, n, m):
+    allocation, maximum, available = make_state("safe", n, m)
+    need = maximum - allocation
+    expected = bankers_algorithm(allocation.tolist(), maximum.tolist(), available.tolist(), order)
+    for engine in BACKENDS.values():
+        assert engine(allocation.tolist(), None, available.tolist(), order, need=need.tolist()) == expected
+    assert BACKENDS["numpy"](allocation, None, available, order, need=need) == expected
+
+
+def test_textbook_state():
+    allocation = [[0, 1, 0], [2, 0, 0], [3, 0, 2], [2, 1, 1], [0, 0, 2]]
+    maximum = [[7, 5, 3], [3, 2, 2], [9, 0, 2], [2, 2, 2], [4, 3, 3]]
+    assert bankers_algorithm(allocation, maximum, [3, 3, 2]) == (True, [1, 3, 0, 2, 4])
+    assert bankers_algorithm(allocation, maximum, [3, 3, 2], "sweep") == (True, [1, 3, 4, 0, 2])
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+@pytest.mark.parametrize("allocation,maximum,available", [
+    ([[0, 0, 0]], [[0, 0, 9]], [0, 0]),  # more columns than Available
+    ([[0, 1], [2, 0]], [[1, 1], [2, 2]], [1, 1, 1]),  # fewer columns than Available
+    ([[0]], [[0], [1]], [1]),  # Max has another process
+])
+def test_malformed_tables_raise_on_every_backend(backend, allocation, maximum, available):
+    with pytest.raises(ValueError):
+        bankers_algorithm(allocation, maximum, available, backend=backend)
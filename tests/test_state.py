@@ -0,0 +1,79 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+import numpy as np
+import pytest
+
+from banker_engine import safe_sequence_worklist
+from banker_state import BankerState
+
+
+def full_check(allocation, need, available):
+    maximum = allocation + need
+    return safe_sequence_worklist(allocation.tolist(), maximum.tolist(), available.tolist(), order="any")[0]
+
+
+def assert_sequence_valid(state):
+    # The sequence kept by the incremental updates must still run to the end.
+    work = state.available.astype(np.int64)
+    assert sorted(state.sequence) == list(range(len(state.allocation)))
+    for pid in state.sequence:
+        assert (state.need[pid] <= work).all()
+        work = work + state.allocation[pid]
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_requests_and_releases_match_a_full_check(seed):
+    rng = np.random.default_rng(seed)
+    n, m = int(rng.integers(1, 60)), int(rng.integers(1, 5))
+    allocation = rng.integers(0, 4, size=(n, m))
+    maximum = allocation + rng.integers(0, 6, size=(n, m))
+    available = rng.integers(0, 8, size=m)
+    state = BankerState(allocation, maximum, available)
+    assert state.is_safe() == full_check(state.allocation, state.need, state.available)
+
+    for _ in range(150):
+        pid = int(rng.integers(n))
+        allocation = state.allocation.astype(np.int64)
+        need = state.need.astype(np.int64)
+        available = state.available.astype(np.int64)
+        if rng.random() < 0.7:
+            vector = rng.integers(0, need[pid] + 1)
+            granted_allocation, granted_need = allocation.copy(), need.copy()
+            granted_allocation[pid] += vector
+            granted_need[pid] -= vector
+            expected = bool((vector <= available).all()) and full_check(granted_allocation, granted_need,
+                                                                         available - vector)
+            assert state.request(pid, vector) == expected
+            if expected:
+                allocation, need, available = granted_allocation, granted_need, available - vector
+        else:
+            vector = rng.integers(0, allocation[pid] + 1)
+            state.release(pid, vector)
+            allocation[pid] -= vector
+            need[pid] += vector
+            available += vector
+
+        np.testing.assert_array_equal(state.allocation, allocation)
+        np.testing.assert_array_equal(state.need, need)
+        np.testing.assert_array_equal(state.available, available)
+        assert state.is_safe() == full_check(allocation, need, available)
+        if state.is_safe():
+            assert_sequence_valid(state)
+
+
+def test_rejects_bad_requests():
+    state = BankerState([[0, 1], [2, 0]], [[3, 2], [2, 2]], [1, 1])
+    with pytest.raises(ValueError):
+        state.request(0, [4, 0])  # more than its maximum claim
+    with pytest.raises(ValueError):
+        state.release(1, [3, 0])  # more than it holds
+    with pytest.raises(ValueError):
+        state.request(0, [1])  # wrong number of resource types
+    for pid in (-1, 2):
+        with pytest.raises(ValueError):
+            state.request(pid, [0, 0])
+        with pytest.raises(ValueError):
+            state.release(pid, [0, 0])
@@ -0,0 +1,131 @@
+# Copyright (C) 2025 UDHAYA046
+# This program is licensed under GPLv3. See LICENSE file for details.
+# Unauthorized use without preserving this notice is a license violation.
+
+
+import io
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from banker_store import (CachedStore, JsonStore, JsonStreamReader, SqliteStore, open_store, stream_datasets,
+                          stream_load, stream_names)
+
+# Names and values with every character the scanner treats specially, inside strings.
+STORE = {
+    "5P_3R": {"allocation": [[0, 1, 0], [2, 0, 0]], "maximum": [[7, 5, 3], [3, 2, 2]], "available": [3, 3, 2]},
+    'quote " {brace} [bracket]': {"allocation": [[1]], "maximum": [[2]], "available": [1], "note": "}]\"{["},
+    "back\\slash": {"allocation": [], "maximum": [], "available": [], "note": "\\\"", "empty": {}},
+    "big numbers": {"allocation": [[123456789012, 0]], "maximum": [[123456789013, 1.5e3]], "available": [-7, 0]},
+    "unicode é中": {"nested": [{"a": [[], {}]}, "x"], "flag": True, "none": None},
+}
+TEXTS = [json.dumps(STORE), json.dumps(STORE, indent=2), json.dumps(STORE, separators=(",", ":"))]
+
+
+def read_names(text, chunk_size):
+    reader = JsonStreamReader(io.StringIO(text), chunk_size)
+    names = []
+    for name in reader.keys():
+        names.append(name)
+        reader.skip()
+    return names
+
+
+def read_one(text, wanted, chunk_size):
+    reader = JsonStreamReader(io.StringIO(text), chunk_size)
+    for name in reader.keys():
+        if name == wanted:
+            return reader.decode()
+        reader.skip()
+    return None
+
+
+def read_all(text, chunk_size):
+    reader = JsonStreamReader(io.StringIO(text), chunk_size)
+    return {name: reader.decode() for name in reader.keys()}
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+@pytest.mark.parametrize("text", TEXTS)
+def test_small_chunks(text, chunk_size):
+    assert read_names(text, chunk_size) == list(STORE)
+    assert read_all(text, chunk_size) == STORE
+    for name, data in STORE.items():
+        assert read_one(text, name, chunk_size) == data
+    assert read_one(text, "missing", chunk_size) is None
+
+
+def test_stream_helpers():
+    text = TEXTS[1]
+    assert stream_names(io.StringIO(text)) == list(STORE)
+    assert dict(stream_datasets(io.StringIO(text))) == STORE
+    assert stream_load(io.StringIO(text), "back\\slash") == STORE["back\\slash"]
+    assert stream_names(io.StringIO("{}")) == []
+
+
+@pytest.mark.parametrize("text", ['{"a": {"x": [1, 2}', '{"a": "unterminated', '{"a" 1}', '["not", "a", "store"]'])
+def test_malformed_stores_raise(text):
+    with pytest.raises(ValueError):
+        read_names(text, 3)
+
+
+@pytest.mark.parametrize("suffix", [".json", ".json.gz", ".json.xz"])
+def test_json_store_round_trip(tmp_path, suffix):
+    store = JsonStore(str(tmp_path / f"store{suffix}"))
+    store.save_many(STORE.items())
+    assert store.names() == list(STORE)
+    assert store.load("big numbers") == STORE["big numbers"]
+    assert dict(store.items()) == STORE
+    store.delete("5P_3R")
+    assert "5P_3R" not in store.names()
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+def test_numbers_cut_by_a_chunk(chunk_size):
+    text = '{"n": 1234567, "m": -6.25e2, "k": [98765]}'
+    assert read_all(text, chunk_size) == {"n": 1234567, "m": -625.0, "k": [98765]}
+    assert read_one(text, "m", chunk_size) == -625.0
+
+
+def save_datasets(path, worker, count):
+    store = open_store(path, None)
+    for k in range(count):
+        store.save(f"w{worker}_{k}", {"allocation": [[worker]], "maximum": [[worker + k]], "available": [k]})
+    return count
+
+
+@pytest.mark.parametrize("suffix", [".json.gz", ".json", ".db"])
+def test_concurrent_saves_keep_every_dataset(tmp_path, suffix):
+    path = str(tmp_path / f"store{suffix}")
+    workers, count = 8, 6
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        assert sum(pool.map(save_datasets, [path] * workers, range(workers), [count] * workers)) == workers * count
+
+    store = open_store(path, None)
+    names = store.names()
+    assert sorted(names) == sorted(f"w{w}_{k}" for w in range(workers) for k in range(count))
+    assert store.load("w3_5") == {"allocation": [[3]], "maximum": [[8]], "available": [5]}
+    if suffix != ".db":
+        assert JsonStore(path).read_pending() == ""
+
+
+def test_torn_pending_line_is_skipped(tmp_path):
+    store = JsonStore(str(tmp_path / "store.json"))
+    store.save("a", {"available": [1]})
+    with open(store.pending_path, "a") as f:
+        f.write('{"name": "half", "da')  # a saver died half way through its line
+    store.save("b", {"available": [2]})
+    assert store.read_all() == {"a": {"available": [1]}, "b": {"available": [2]}}
+    assert store.read_pending() == ""
+
+
+def test_cached_store_sees_other_connections(tmp_path):
+    path = str(tmp_path / "store.db")
+    cached = CachedStore(SqliteStore(path))
+    cached.save("x", {"allocation": [], "available": []})
+    assert cached.names() == ["x"]
+    SqliteStore(path).save("y", {"allocation": [], "available": [1]})
+    assert cached.names() == ["x", "y"]
+    assert cached.load("y") == {"allocation": [], "available": [1]}